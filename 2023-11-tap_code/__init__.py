@@ -1,7 +1,17 @@
-from . import optimized, proper
+import random
+import string
 
+from . import codec, optimized, proper, streaming, table, vectorized
 
-tested_functions = [('optimized', optimized.convert), ('proper', proper.convert)]
+
+tested_functions = [
+    ('optimized', optimized.convert),
+    ('proper', proper.convert),
+    ('table', table.convert),
+    ('streaming', streaming.convert),
+    ('vectorized', vectorized.convert),
+    ('codec', codec.LATIN.convert),
+]
 
 test_cases = [
     (('greeting',), '.. .. .... .. . ..... . ..... .... .... .. .... ... ... .. ..'),
@@ -19,3 +29,10 @@ test_cases = [
         'abcdefghijclmnopqrstuvwxyz',
     ),
 ]
+
+
+def generate_case(size: int, seed: int) -> tuple[str]:
+    rng: random.Random = random.Random(seed)
+    text: str = ''.join(rng.choices(string.ascii_lowercase, k=size))
+
+    return (codec.LATIN.encode(text) if seed % 2 else text,)  # Odd seeds give taps, so the decoders get exercised too
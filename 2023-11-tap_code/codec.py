@@ -0,0 +1,57 @@
+import functools
+import string
+
+
+TAP: str = '.'
+
+
+class TapCodec:
+    alphabet: str
+    width: int
+    encode_table: dict[int, str]
+    decode_table: dict[tuple[str, str], str]
+
+    def __init__(self, alphabet: str, width: int, merges: tuple[tuple[str, str], ...] = ()):
+        if len(alphabet) > width * width:
+            raise ValueError(f'{len(alphabet)} letters do not fit in a {width}x{width} grid!')
+
+        self.alphabet = alphabet
+        self.width = width
+
+        letter_taps: dict[str, str] = {
+            letter: f' {TAP * (1 + cell_id // width)} {TAP * (1 + cell_id % width)}' for cell_id, letter in enumerate(alphabet)
+        }
+        self.decode_table = {tuple(taps.split()): letter for letter, taps in letter_taps.items()}
+
+        for letter, replacement in merges:  # Letters without a cell of their own, like K sharing C's
+            if replacement not in alphabet:
+                raise ValueError(f'{letter!r} can not share the cell of {replacement!r}, which is not in the alphabet!')
+
+            letter_taps[letter] = letter_taps[replacement]
+
+        # Uppercase letters share their lowercase letter's cell, unless they have a cell of their own
+        upper_taps: dict[str, str] = {letter.upper(): taps for letter, taps in letter_taps.items() if letter.upper() not in letter_taps}
+        self.encode_table = str.maketrans(letter_taps | upper_taps)
+
+    def encode(self, text: str) -> str:
+        return text.translate(self.encode_table)[1:]
+
+    def decode(self, taps: str) -> str:
+        groups: list[str] = taps.split()
+
+        return ''.join(map(self.decode_table.__getitem__, zip(groups[::2], groups[1::2])))
+
+    def convert(self, text: str) -> str:
+        if text[0] == TAP:
+            return self.decode(text)
+        else:
+            return self.encode(text)
+
+
+@functools.lru_cache(maxsize=32)
+def tap_codec(alphabet: str, width: int, merges: tuple[tuple[str, str], ...] = ()) -> TapCodec:
+    return TapCodec(alphabet, width, merges)
+
+
+LATIN: TapCodec = tap_codec(string.ascii_lowercase.replace('k', ''), 5, (('k', 'c'),))
+ALPHANUMERIC: TapCodec = tap_codec(string.ascii_lowercase + string.digits, 6)
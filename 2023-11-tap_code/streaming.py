@@ -0,0 +1,88 @@
+from typing import IO, Iterator
+
+from .table import DECODE_TABLE, ENCODE_TABLE
+
+
+# The table implementation, but fed a chunk at a time, so a message of any size can be transcoded without ever holding all of it
+# Encoding letters never depends on the letters around them, but a chunk of taps can end partway through a tap group
+
+
+CHUNK_SIZE: int = 64 * 1024
+
+
+class TapEncoder:
+    started: bool
+
+    def __init__(self):
+        self.started = False
+
+    def feed(self, chunk: str) -> str:
+        taps: str = chunk.translate(ENCODE_TABLE)
+
+        if not self.started and taps:
+            self.started = True
+            return taps[1:]  # Only the very first letter has no space before it
+
+        return taps
+
+    def flush(self) -> str:
+        return ''
+
+
+class TapDecoder:
+    pending: str  # The start of a tap group that the next chunk finishes
+
+    def __init__(self):
+        self.pending = ''
+
+    def feed(self, chunk: str) -> str:
+        text: str = self.pending + chunk
+
+        end: int = len(text)
+        while end and not text[end - 1].isspace():  # The taps after the last whitespace might continue in the next chunk
+            end -= 1
+
+        complete, self.pending = text[:end], text[end:]
+
+        taps: list[str] = complete.split()
+        if len(taps) % 2:
+            self.pending = f'{taps.pop()} {self.pending}'  # Its second half is still on the way
+
+        return ''.join(map(DECODE_TABLE.__getitem__, zip(taps[::2], taps[1::2])))
+
+    def flush(self) -> str:
+        taps: list[str] = self.pending.split()
+        self.pending = ''
+
+        if len(taps) % 2:
+            raise ValueError('The taps ended halfway through a letter!')
+
+        return ''.join(map(DECODE_TABLE.__getitem__, zip(taps[::2], taps[1::2])))
+
+
+def transcode(coder: TapEncoder | TapDecoder, chunks: Iterator[str]) -> Iterator[str]:
+    for chunk in chunks:
+        if converted := coder.feed(chunk):
+            yield converted
+
+    if converted := coder.flush():
+        yield converted
+
+
+def read_chunks(file: IO[str], chunk_size: int) -> Iterator[str]:
+    while chunk := file.read(chunk_size):
+        yield chunk
+
+
+def encode_file(file: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    return transcode(TapEncoder(), read_chunks(file, chunk_size))
+
+
+def decode_file(file: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    return transcode(TapDecoder(), read_chunks(file, chunk_size))
+
+
+def convert(input_text: str) -> str:
+    chunks: Iterator[str] = (input_text[start : start + CHUNK_SIZE] for start in range(0, len(input_text), CHUNK_SIZE))
+
+    return ''.join(transcode(TapDecoder() if input_text[0] == '.' else TapEncoder(), chunks))
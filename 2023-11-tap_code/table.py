@@ -0,0 +1,18 @@
+from .codec import LATIN
+
+
+# Instead of working out the taps for one letter at a time, every letter's taps are worked out once when the module is imported
+# Then both directions are a single pass of C code over the whole text: str.translate to encode, and split + dict lookups to decode
+
+
+ENCODE_TABLE: dict[int, str] = LATIN.encode_table
+DECODE_TABLE: dict[tuple[str, str], str] = LATIN.decode_table
+
+
+def convert(input_text: str) -> str:
+    if input_text[0] == '.':
+        taps: list[str] = input_text.split()
+
+        return ''.join(map(DECODE_TABLE.__getitem__, zip(taps[::2], taps[1::2])))
+    else:
+        return input_text.translate(ENCODE_TABLE)[1:]
@@ -0,0 +1,76 @@
+from .table import DECODE_TABLE, ENCODE_TABLE
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Decoding in the table implementation still does a dict lookup per letter, so here the taps are decoded as bytes instead
+# Only counting the taps in each group is done per group, everything after that works on the whole message at once
+
+
+WHITESPACE: bytes = b' \t\n\r\x0b\x0c'  # What bytes.split() splits on
+TIMES_FIVE: bytes = bytes(5 * taps if taps <= 5 else 0 for taps in range(256))
+
+
+def cell_letters() -> bytes:
+    letters: bytearray = bytearray(256)  # By 5 * rows + columns
+
+    for (row_taps, column_taps), letter in DECODE_TABLE.items():
+        letters[5 * len(row_taps) + len(column_taps)] = ord(letter)
+
+    return bytes(letters)
+
+
+CELL_LETTERS: bytes = cell_letters()
+
+
+def check_groups(groups: int, most_taps: int):
+    if most_taps > 5:  # Which also means no row and column can add up to more than a byte
+        raise ValueError(f'A group of {most_taps} taps is more than the 5 rows and columns there are!')
+
+    if groups % 2:
+        raise ValueError('The taps ended halfway through a letter!')
+
+
+def tap_counts(taps: bytes) -> bytes:
+    counts: bytes = bytes(map(len, taps.split()))
+    check_groups(len(counts), max(counts, default=0))
+
+    return counts
+
+
+def numpy_cells(taps: bytes) -> bytes:
+    is_tap: numpy.ndarray = numpy.frombuffer(taps, numpy.uint8) == ord('.')
+    edges: numpy.ndarray = numpy.flatnonzero(numpy.diff(numpy.concatenate(([False], is_tap, [False])).astype(numpy.int8)))
+    counts: numpy.ndarray = edges[1::2] - edges[::2]  # Every group starts and ends where taps start and stop
+    check_groups(len(counts), int(counts.max(initial=0)))
+
+    return (5 * counts[::2] + counts[1::2]).astype(numpy.uint8).tobytes()
+
+
+def cells(taps: bytes) -> bytes:
+    if taps.translate(None, b'.' + WHITESPACE):
+        raise ValueError('Only taps and whitespace can be decoded!')
+
+    if numpy is not None:
+        return numpy_cells(taps)
+
+    counts: memoryview = memoryview(tap_counts(taps))
+    rows, columns = counts[::2].tobytes().translate(TIMES_FIVE), counts[1::2].tobytes()
+
+    # Adding the two as big integers adds every pair of bytes in one go
+    return (int.from_bytes(rows, 'big') + int.from_bytes(columns, 'big')).to_bytes(len(columns), 'big')
+
+
+def taps_to_word(taps: str) -> str:
+    return cells(taps.encode('ascii')).translate(CELL_LETTERS).decode('ascii')
+
+
+def convert(input_text: str) -> str:
+    if input_text[0] == '.':
+        return taps_to_word(input_text)
+    else:
+        return input_text.translate(ENCODE_TABLE)[1:]
@@ -1,7 +1,12 @@
+import math
+import random
+
 from . import north_pole
 
 
-tested_function = north_pole.create_map
+tested_functions = [('cells', north_pole.create_map_cells), ('rows', north_pole.create_map_rows)]
+if north_pole.numpy is not None:  # The numpy backend is optional, so it's only compared when it can be imported
+    tested_functions.append(('numpy', north_pole.create_map_numpy))
 
 test_cases = [
     (
@@ -60,3 +65,16 @@ test_cases = [
         ],
     ),
 ]
+
+
+def generate_case(size: int, seed: int) -> tuple[str]:
+    rng: random.Random = random.Random(seed)
+    side: int = max(2, math.isqrt(size))  # Size is the number of map cells
+
+    rows: list[list[str]] = [['.'] * side for _ in range(side)]
+    for symbol in ('S', 'T'):  # Tags go second, so at least one is always left for the sensors to measure against
+        for _ in range(max(1, side // 8)):
+            rows[rng.randrange(side)][rng.randrange(side)] = symbol
+
+    label_width: int = len(str(side)) + 4
+    return ('\n' + '\n'.join(f'{row_id:<{label_width}}{"".join(row)}' for row_id, row in enumerate(rows)),)
@@ -3,6 +3,12 @@ from __future__ import annotations
 from typing import Iterator, NamedTuple
 
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
 class Vec(NamedTuple):
     x: int
     y: int
@@ -31,7 +37,7 @@ def get_symbol_positions(symbol: str, original_map: str, map_start: int, chars_p
         # Modulo to get position within the line, divide to get total # of lines passed
 
 
-def create_map(original_map: str) -> list[list[int]]:
+def read_map(original_map: str) -> tuple[Vec, list[tuple[Vec, int]]]:
     first_map_symbols: list[int] = []
     for row_character in ('S', 'T', '.'):
         try:
@@ -51,10 +57,12 @@ def create_map(original_map: str) -> list[list[int]]:
     sensors: Iterator[Vec] = get_symbol_positions('S', original_map, map_start, chars_per_line)
     tags: list[Vec] = [*get_symbol_positions('T', original_map, map_start, chars_per_line)]
 
-    deadzone_map: list[list[int]] = [[1] * size.x for _ in [None] * size.y]  # First assume all coordinates are deadzones
-    for sensor in sensors:
-        radius: int = min(map(sensor.manhattan_dist, tags))
+    return size, [(sensor, min(map(sensor.manhattan_dist, tags))) for sensor in sensors]
 
+
+def deadzone_cells(size: Vec, sensors: list[tuple[Vec, int]]) -> list[list[int]]:
+    deadzone_map: list[list[int]] = [[1] * size.x for _ in [None] * size.y]  # First assume all coordinates are deadzones
+    for sensor, radius in sensors:
         # use max/min to limit the range to be within the map bounds,
         for sensed_x in range(max(sensor.x - radius, 0), min(sensor.x + radius + 1, size.x)):
             column_height: int = radius - abs(sensed_x - sensor.x)
@@ -63,3 +71,54 @@ def create_map(original_map: str) -> list[list[int]]:
                 deadzone_map[sensed_y][sensed_x] = 0
 
     return deadzone_map
+
+
+def deadzone_rows(size: Vec, sensors: list[tuple[Vec, int]]) -> list[list[int]]:
+    deadzone_map: list[list[int]] = [[1] * size.x for _ in [None] * size.y]  # First assume all coordinates are deadzones
+    for sensor, radius in sensors:
+        # use max/min to limit the range to be within the map bounds,
+        for sensed_y in range(max(sensor.y - radius, 0), min(sensor.y + radius + 1, size.y)):
+            row_radius: int = radius - abs(sensed_y - sensor.y)
+            start, end = max(sensor.x - row_radius, 0), min(sensor.x + row_radius + 1, size.x)
+
+            deadzone_map[sensed_y][start:end] = [0] * (end - start)  # Each row of the diamond is one slice, rather than a cell at a time
+
+    return deadzone_map
+
+
+def deadzone_array(size: Vec, sensors: list[tuple[Vec, int]]) -> numpy.ndarray:
+    deadzone_map: numpy.ndarray = numpy.ones((size.y, size.x), numpy.uint8)
+    for sensor, radius in sensors:
+        top, bottom = max(sensor.y - radius, 0), min(sensor.y + radius + 1, size.y)
+        left, right = max(sensor.x - radius, 0), min(sensor.x + radius + 1, size.x)
+
+        distances: numpy.ndarray = numpy.abs(numpy.arange(top, bottom) - sensor.y)[:, None] + numpy.abs(numpy.arange(left, right) - sensor.x)
+        deadzone_map[top:bottom, left:right][distances <= radius] = 0  # The slice is a view, so this writes into the map
+
+    return deadzone_map
+
+
+def create_array(original_map: str) -> numpy.ndarray:  # For callers that can use the map as an array, and skip converting it to lists
+    if numpy is None:
+        raise ModuleNotFoundError('Creating the map as an array needs numpy, which is not installed!')
+
+    return deadzone_array(*read_map(original_map))
+
+
+def create_map_cells(original_map: str) -> list[list[int]]:
+    return deadzone_cells(*read_map(original_map))
+
+
+def create_map_rows(original_map: str) -> list[list[int]]:
+    return deadzone_rows(*read_map(original_map))
+
+
+def create_map_numpy(original_map: str) -> list[list[int]]:
+    return create_array(original_map).tolist()
+
+
+def create_map(original_map: str) -> list[list[int]]:
+    if numpy is not None:
+        return create_map_numpy(original_map)
+    else:
+        return create_map_rows(original_map)
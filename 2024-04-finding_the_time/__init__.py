@@ -1,3 +1,5 @@
+import random
+
 from . import proper
 
 
@@ -26,3 +28,21 @@ test_cases = [
         ['25-12-2000_13:13', '23-01-2022_01:24', '24-01-2023_11:19', '09-11-2020_04:28', '27-04-2005_11:57'],
     ),
 ]
+
+
+def generate_case(size: int, seed: int) -> tuple[list[str], list[str]]:
+    rng: random.Random = random.Random(seed)
+
+    dates: list[str] = [
+        f'{rng.randint(1, 28):02}-{rng.randint(1, 12):02}-{rng.randint(1990, 2024)}_{rng.randint(0, 23):02}:{rng.randint(0, 59):02}'
+        for _ in range(size)
+    ]
+    operations: list[str] = [
+        rng.choice(['ASC', 'DSC']),
+        f'UP-{rng.randint(1, 12):02}',
+        f'DOWN-{rng.randint(1, 28):02}',
+        f'TOP-{rng.randint(1990, 2024)}',
+        f'BOT-{rng.randint(1990, 2024)}',
+    ]
+
+    return (dates, operations)
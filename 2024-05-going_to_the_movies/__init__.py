@@ -1 +1 @@
-from .seat_count import test_cases, tested_functions
+from .seat_count import generate_case, test_cases, tested_functions
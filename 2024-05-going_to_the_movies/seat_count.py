@@ -1,3 +1,6 @@
+import math
+import random
+
 from . import optimized, proper
 
 
@@ -34,3 +37,13 @@ test_cases = [
         1,
     ),
 ]
+
+
+def generate_case(size: int, seed: int) -> tuple[list[list[int]], int]:
+    rng: random.Random = random.Random(seed)
+    side: int = max(2, math.isqrt(size))  # Size is the number of seats
+
+    seats: list[list[int]] = [[int(rng.random() < 0.6) for _ in range(side)] for _ in range(side)]
+    seats[0] = [0] * side  # Make sure the group always fits somewhere
+
+    return (seats, 2)
@@ -1,4 +1,5 @@
 from . import optimized, proper
+from .seat_count import generate_case
 
 
 tested_functions = [('proper', proper.optimal_seats), ('optimized', optimized.optimal_seats)]
@@ -1,6 +1,14 @@
+import random
+
 from . import quick_and_dirty
 
 
 tested_function = quick_and_dirty.decipher
 
 test_cases = [((["1233", "1234", "1243"],), "3777"), ((["1235", "2346", "3457", "9999", "3333", "5559", "4567"],), "7390")]
+
+
+def generate_case(size: int, seed: int) -> tuple[list[str]]:
+    rng: random.Random = random.Random(seed)
+
+    return ([f'{rng.randrange(10_000):04}' for _ in range(size - 1)] + ['9999'],)  # 9999 is a break, so decoding always ends
@@ -1,3 +1,4 @@
+import random
 from typing import Self
 
 from . import optimized, proper
@@ -123,3 +124,15 @@ def piece_to_comparable(piece: str) -> Piece:
 
 def verify(pieces_1: list[str], pieces_2: list[str]) -> bool:
     return set(map(piece_to_comparable, pieces_1)) == set(map(piece_to_comparable, pieces_2))
+
+
+def generate_piece(rng: random.Random) -> str:
+    edge_count: int = rng.randint(3, 6)
+
+    return ''.join(f'@{direction}' + ''.join(str(rng.randint(-3, 3)) for _ in range(edge_count)) for direction in rng.sample('TBLR', 4))
+
+
+def generate_case(size: int, seed: int) -> tuple[list[str]]:
+    rng: random.Random = random.Random(seed)
+
+    return (['@T000@B000@L000@R000'] + [generate_piece(rng) for _ in range(size - 1)],)  # The first piece is always valid
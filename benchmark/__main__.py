@@ -1,57 +1,400 @@
-import gc
+import argparse
+import inspect
 import logging
+import os
 import sys
-from typing import Any
+from typing import Any, Iterator
 
-from benchmark.errors import IncorrectOutput
-
-from .config import TestProfile, setup
+from .coldstart import ColdStart, measure_cold_start
+from .comparison import Comparison, compare
+from .complexity import Growth, geometric_sizes, measure_growth
+from .config import TestedFunction, TestProfile, project_name
+from .datasets import CACHE_VARIABLE, DEFAULT_CACHE
+from .discovery import discover
+from .errors import IncorrectOutput
+from .fuzzing import FuzzReport, fuzz
+from .isolation import run_isolated
+from .ordering import regroup, shuffled_schedule
+from .parallel import available_cores, run_parallel
+from .report import cold_start_tables, comparison_table, fuzz_summary, growth_table, regression_table, summary_table, throughput_table
+from .runner import Result, Task, load_profile, plan_tasks, run_serial
+from .store import Record, baseline_records, find_regressions, load_records, measurement_settings, save_records, to_records
+from .throughput import Throughput, measure_throughput
 
 
 log = logging.getLogger(__name__)
 
 
-def main(test_profile: TestProfile[Any], project_name: str):
-    for title, tested_function in test_profile.functions:
-        implementation_name: str = f"{title} " if title else ""
-        implementation_name += "implementation"
+def positive_int(value: str) -> int:
+    number: int = int(value)
 
-        print(f'=== Testing {implementation_name} for {project_name} ===')
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, not {number}')
 
-        for case_id, test in enumerate(test_profile.cases, start=1):
-            print(f'Test #{case_id} result: ', end='')
+    return number
+
+
+def main(module_names: list[str], arguments: argparse.Namespace) -> list[Result]:
+    tasks: list[Task] = plan_tasks(module_names, arguments.test_repetitions)
+    schedule: list[Task] = shuffled_schedule(tasks, arguments.blocks, arguments.seed) if arguments.shuffle else tasks
+
+    outcomes: Iterator[Result]
+    if arguments.isolate:
+        outcomes = run_isolated(schedule, arguments, arguments.jobs)
+    elif arguments.jobs > 1:
+        outcomes = run_parallel(schedule, arguments, arguments.jobs)
+    else:
+        outcomes = run_serial(schedule, arguments)
+
+    if arguments.shuffle:  # Nothing can be shown until every block of a case has run, so wait for all of them
+        print(f'Running {len(schedule)} blocks in a shuffled order...')
+        outcomes = iter(regroup(tasks, schedule, list(outcomes), arguments.stats))
+
+    results: list[Result] = []
+    previous_task: Task | None = None
+
+    for task, result in zip(tasks, outcomes):
+        if previous_task is None or (previous_task.module_name, previous_task.implementation) != (task.module_name, task.implementation):
+            implementation_name: str = f"{task.implementation} " if task.implementation else ""
+            implementation_name += "implementation"
+
+            print(f'=== Testing {implementation_name} for {project_name(task.module_name)} ===')
+
+        print(f'Test #{task.case} result: {result.describe(arguments.autorange is not None)}')
+
+        results.append(result)
+        previous_task = task
+
+    return results
+
+
+def complexity(module_names: list[str], arguments: argparse.Namespace) -> list[Growth]:
+    sizes: list[int] = geometric_sizes(arguments.min_size, arguments.max_size, arguments.size_factor)
+    growths: list[Growth] = []
+
+    for module_name in module_names:
+        test_profile: TestProfile[Any] = load_profile(module_name, arguments.test_repetitions)
+
+        if test_profile.generate is None:
+            print(f'Skipping {project_name(module_name)}, as it has no generate_case')
+            continue
 
+        for title, function in test_profile.functions:
+            if inspect.iscoroutinefunction(function):
+                print(f'Skipping {title or "the"} implementation for {project_name(module_name)}, as --complexity does not support coroutines')
+                continue
+
+            print(f'Measuring growth of {title or "the"} implementation for {project_name(module_name)}...')
+            growths.append(
+                measure_growth(
+                    test_profile, project_name(module_name), title, sizes, arguments.seed, arguments.autorange or 0.05, arguments.pool_size
+                )
+            )
+
+    return growths
+
+
+def head_to_head(module_names: list[str], arguments: argparse.Namespace) -> list[Comparison]:
+    baseline_name, candidate_name = (name.lower() for name in arguments.head_to_head)
+    comparisons: list[Comparison] = []
+
+    for module_name in module_names:
+        test_profile: TestProfile[Any] = load_profile(module_name, arguments.test_repetitions)
+        functions: dict[str, tuple[str, TestedFunction[Any]]] = {title.lower(): (title, function) for title, function in test_profile.functions}
+
+        if baseline_name not in functions or candidate_name not in functions:
+            print(f'Skipping {project_name(module_name)}, as it lacks one of the implementations')
+            continue
+
+        if any(inspect.iscoroutinefunction(functions[name][1]) for name in (baseline_name, candidate_name)):
+            print(f'Skipping {project_name(module_name)}, as --head-to-head does not support coroutines')
+            continue
+
+        for case_id, test in enumerate(test_profile.cases, start=1):
             try:
-                gc.disable()
-                print(f'Success! Took {test.benchmark(tested_function) * 1000} ms on average to complete!')
-            except IncorrectOutput as output:
-                output = output.format(test_profile.display)
-                print('Failure! Unexpected output.', 'Input:', *test.args, 'Expected:', output.expected, 'Actual:', output.actual, sep='\n')
+                if arguments.autorange is not None:  # The slower of the two decides, so neither gets too few calls per sample
+                    test.repetitions = min(test.autorange(functions[name][1], arguments.autorange) for name in (baseline_name, candidate_name))
+
+                comparisons.append(
+                    compare(
+                        project_name(module_name),
+                        case_id,
+                        test,
+                        functions[baseline_name],
+                        functions[candidate_name],
+                        arguments.samples,
+                        arguments.confidence,
+                        arguments.seed,
+                    )
+                )
+            except IncorrectOutput:
+                print(f'Skipping case #{case_id} of {project_name(module_name)}, as one of the implementations gave an unexpected output')
             except Exception as e:
-                print('Failure! Raised an exception.')
+                print(f'Skipping case #{case_id} of {project_name(module_name)}, as one of the implementations raised an exception')
                 log.error('Showing exception', exc_info=e)
-            finally:
-                gc.enable()
-                gc.collect()
 
+    return comparisons
+
+
+def throughput(module_names: list[str], arguments: argparse.Namespace) -> list[Throughput]:
+    throughputs: list[Throughput] = []
+
+    for task in plan_tasks(module_names, arguments.test_repetitions):
+        test_profile: TestProfile[Any] = load_profile(task.module_name, arguments.test_repetitions)
+
+        if inspect.iscoroutinefunction(dict(test_profile.functions)[task.implementation]):
+            print(
+                f'Skipping {task.implementation or "the"} implementation for {project_name(task.module_name)}, as --throughput does not support coroutines'
+            )
+            continue
+
+        print(
+            f'Measuring throughput of case #{task.case} of {task.implementation or "the"} implementation'
+            f' for {project_name(task.module_name)}...'
+        )
+
+        try:
+            throughputs += measure_throughput(
+                project_name(task.module_name),
+                task,
+                arguments.test_repetitions,
+                arguments.workers,
+                arguments.duration,
+                arguments.pool_size if arguments.fresh_args else None,
+            )
+        except IncorrectOutput:
+            print('Skipping it, as it gave an unexpected output')
+        except Exception as e:
+            print('Skipping it, as it raised an exception')
+            log.error('Showing exception', exc_info=e)
+
+    return throughputs
+
+
+parser = argparse.ArgumentParser('benchmark')
+parser.add_argument('module_name', nargs='?')
+parser.add_argument('test_repetitions', nargs='?', type=int, default=1_000_000)
+parser.add_argument(
+    '--all', action='store_true', help='benchmark every challenge module found in the current directory and print a summary table'
+)
+parser.add_argument(
+    '--autorange',
+    type=float,
+    metavar='SECONDS',
+    help='pick the repetition count per case so that each sample takes roughly SECONDS, instead of using test_repetitions',
+)
+parser.add_argument('--stats', action='store_true', help='time repeated samples and report min/median/p90/p99/stddev instead of the mean')
+parser.add_argument('--samples', type=positive_int, default=10, help='number of samples to take in --stats mode')
+parser.add_argument('--warmup', type=int, default=1, help='number of discarded warmup samples to take in --stats mode')
+parser.add_argument(
+    '--fresh-args',
+    action='store_true',
+    help='give every call its own deep copy of the args, copied outside the timed region, for functions that mutate their input',
+)
+parser.add_argument('--pool-size', type=int, default=1000, help='how many copies of the args --fresh-args prepares at a time')
+parser.add_argument(
+    '--calibrate', action='store_true', help='measure the cost of calling an empty function with the same args, and subtract it'
+)
+parser.add_argument(
+    '--gc',
+    action='store_true',
+    help='keep the garbage collector enabled while timing, and report how often each generation was collected and for how long',
+)
+parser.add_argument('--memory', action='store_true', help='also report peak bytes and allocated blocks per call using tracemalloc')
+parser.add_argument('--latency', action='store_true', help='also time every call on its own and show a histogram of per-call latencies')
+parser.add_argument(
+    '--histogram-dir', metavar='DIR', help='export each --latency histogram as JSON into DIR, for merging with `python -m benchmark.histogram`'
+)
+parser.add_argument('--profile', action='store_true', help='run each case under cProfile and show the functions it spends the most time in')
+parser.add_argument('--profile-calls', type=int, default=1000, help='how many calls --profile records')
+parser.add_argument('--profile-top', type=int, default=10, help='how many of the hottest functions --profile shows')
+parser.add_argument('--profile-dir', metavar='DIR', help='also save a .pstats file per implementation and case into DIR')
+parser.add_argument(
+    '--complexity',
+    action='store_true',
+    help="instead of the test cases, time each challenge's generate_case inputs over growing sizes and fit the growth exponent",
+)
+parser.add_argument('--min-size', type=int, default=64, help='smallest input size --complexity generates')
+parser.add_argument('--max-size', type=int, default=16384, help='largest input size --complexity generates')
+parser.add_argument('--size-factor', type=int, default=4, help='how much --complexity grows the input size by each step')
+parser.add_argument('--seed', type=int, default=0, help='random seed passed to generate_case')
+parser.add_argument(
+    '--head-to-head',
+    nargs=2,
+    metavar=('BASELINE', 'CANDIDATE'),
+    help='interleave --samples samples of two implementations in a random order and test whether their difference is significant',
+)
+parser.add_argument('--confidence', type=float, default=0.95, help='confidence level of the --head-to-head speedup interval')
+parser.add_argument('--alpha', type=float, default=0.05, help='p-value below which --head-to-head calls a difference significant')
+parser.add_argument(
+    '--throughput',
+    action='store_true',
+    help='call each case from thread pools and process pools of every --workers size for --duration seconds, and report calls/second',
+)
+parser.add_argument(
+    '--workers',
+    type=lambda counts: [int(count) for count in counts.split(',')],
+    default=[1, 2, 4],
+    help='comma separated pool sizes for --throughput',
+)
+parser.add_argument('--duration', type=float, default=1.0, help='seconds each --throughput measurement lasts')
+parser.add_argument(
+    '--startup',
+    action='store_true',
+    help='in a fresh interpreter per challenge, measure the import time of each module it pulls in and the first call against steady state',
+)
+parser.add_argument('--startup-top', type=int, default=10, help='how many of the slowest imports --startup shows')
+parser.add_argument(
+    '--concurrency', type=int, default=100, help='how many coroutines run at once when measuring tasks/second of async implementations'
+)
+parser.add_argument(
+    '--fuzz',
+    action='store_true',
+    help="run every implementation on random generate_case inputs across worker processes and report the first one they disagree on",
+)
+parser.add_argument('--fuzz-inputs', type=int, default=100, help='how many random inputs --fuzz tries')
+parser.add_argument('--fuzz-size', type=int, default=1000, help='input size --fuzz passes to generate_case')
+parser.add_argument(
+    '--dataset-cache',
+    metavar='DIR',
+    help=f'where generate_case inputs are cached between runs (default {DEFAULT_CACHE}), or an empty string to always generate them',
+)
+parser.add_argument(
+    '--shuffle',
+    action='store_true',
+    help='run implementations, cases and --blocks in an order shuffled with --seed, so none of them is consistently run first or last',
+)
+parser.add_argument(
+    '--blocks', type=int, default=1, help='with --shuffle, split the repetitions of every case into this many separately shuffled blocks'
+)
+parser.add_argument('--jobs', type=int, default=1, metavar='N', help='run cases across N worker processes, each pinned to its own core')
+parser.add_argument(
+    '--isolate', action='store_true', help='benchmark every case in a fresh interpreter, so implementations cannot warm up for each other'
+)
+parser.add_argument('--store', default='benchmark_results.jsonl', metavar='PATH', help='JSON-lines file every run is appended to')
+parser.add_argument('--no-store', action='store_true', help="don't append this run to the results store")
+parser.add_argument(
+    '--compare-to', metavar='COMMIT', help='exit non-zero if any case got slower than the stored results for COMMIT on this machine'
+)
+parser.add_argument(
+    '--threshold', type=float, default=10, metavar='PERCENT', help='slowdown allowed by --compare-to before it counts as a regression'
+)
+
+if __name__ == '__main__':
+    arguments: argparse.Namespace = parser.parse_args()
+
+    if arguments.dataset_cache is not None:
+        os.environ[CACHE_VARIABLE] = arguments.dataset_cache
+
+    if arguments.all:
+        if arguments.module_name is not None:  # With --all, the only positional argument is the repetition count
+            try:
+                arguments.test_repetitions = int(arguments.module_name)
+            except ValueError:
+                parser.error('--all does not take a module name')
+
+        module_names: list[str] = discover(os.getcwd())
+    elif arguments.module_name is not None:
+        module_names = [arguments.module_name]
+    else:
+        parser.error('either a module name or --all is required')
+
+    if arguments.blocks < 1:
+        parser.error('--blocks must be at least 1')
+
+    if arguments.head_to_head is not None:
+        comparisons: list[Comparison] = head_to_head(module_names, arguments)
+
+        if comparisons:
+            print(comparison_table(comparisons, arguments.confidence, arguments.alpha))
+
+        sys.exit()
+
+    if arguments.fuzz:
+        diverged: bool = False
+
+        for module_name in module_names:
+            test_profile: TestProfile[Any] = load_profile(module_name, arguments.test_repetitions)
+
+            coroutines: list[str] = [title for title, function in test_profile.functions if inspect.iscoroutinefunction(function)]
+            if coroutines:
+                print(f'Leaving out {", ".join(coroutines)} from fuzzing {project_name(module_name)}, as --fuzz does not support coroutines')
+
+            if test_profile.generate is None or len(test_profile.functions) - len(coroutines) < 2:
+                print(
+                    f'Skipping {project_name(module_name)}, as it needs generate_case and at least two implementations that are not coroutines'
+                )
+                continue
+
+            report: FuzzReport = fuzz(
+                project_name(module_name),
+                module_name,
+                arguments.test_repetitions,
+                arguments.fuzz_size,
+                arguments.fuzz_inputs,
+                arguments.seed,
+                arguments.jobs if arguments.jobs > 1 else len(available_cores()),
+            )
+
+            print(fuzz_summary(report), end='\n\n')
+            diverged |= report.divergence is not None
+
+        sys.exit(1 if diverged else 0)
+
+    if arguments.startup:
+        for module_name in module_names:
+            cold_start: ColdStart | None = measure_cold_start(project_name(module_name), module_name)
+
+            if cold_start is None:
+                print(f'Failed to measure the cold start of {project_name(module_name)}!')
+            else:
+                print(cold_start_tables(cold_start, arguments.startup_top), end='\n\n')
+
+        sys.exit()
+
+    if arguments.throughput:
+        throughputs: list[Throughput] = throughput(module_names, arguments)
+
+        if throughputs:
+            print(throughput_table(throughputs))
+
+        sys.exit()
+
+    if arguments.complexity:
+        growths: list[Growth] = complexity(module_names, arguments)
+
+        if growths:
+            print(growth_table(growths))
+
+        sys.exit()
+
+    if arguments.shuffle:
+        arguments.test_repetitions = max(arguments.test_repetitions // arguments.blocks, 1)  # Each block gets its share
+
+    results: list[Result] = main(module_names, arguments)
 
-usage: str = 'Usage: `benchmark <module_name> <test_repetitions=1_000_000>`'
+    if arguments.all:
+        print(summary_table(results))
 
-if len(sys.argv) < 2:
-    print(usage)
+    stored_records: list[Record] = load_records(arguments.store)  # Read before saving, so this run can't be its own baseline
+    current_records: list[Record] = to_records(results, measurement_settings(arguments))
 
-module_name: str = sys.argv[1]
+    exit_code: int = 0
+    if arguments.compare_to is not None:
+        baseline: dict[tuple[str, str, str, int, str], Record] = baseline_records(stored_records, arguments.compare_to)
+        regressions: list[tuple[Record, Record]] = find_regressions(current_records, baseline, arguments.threshold)
 
-test_repetitions: int
-if len(sys.argv) > 2:
-    try:
-        test_repetitions = int(sys.argv[2])
-    except ValueError:
-        print(f'Argument 2 must be readable as an integer!\n{usage}')
-        exit()
-else:
-    test_repetitions = 1_000_000
+        if not any(record.key in baseline for record in current_records):
+            print(f'No stored results for {arguments.compare_to} on this machine, from a clean checkout, measured with the same settings!')
+            exit_code = 2
+        elif regressions:
+            print(f'Regressions of more than {arguments.threshold}% against {arguments.compare_to}:')
+            print(regression_table(regressions))
+            exit_code = 1
+        else:
+            print(f'No regressions of more than {arguments.threshold}% against {arguments.compare_to}.')
 
-project_name = module_name[module_name.rfind('-') + 1 :].replace('_', ' ')
+    if not arguments.no_store and exit_code != 1:  # A run that failed the comparison must not become the next baseline
+        save_records(arguments.store, current_records)
 
-main(setup(module_name, test_repetitions), project_name)
+    sys.exit(exit_code)
@@ -0,0 +1,61 @@
+import asyncio
+import copy
+import time
+from typing import Any, Awaitable, Callable
+
+from .config import Args, Test, async_noop_with_arity
+from .errors import IncorrectOutput
+
+
+CoroutineFunction = Callable[..., Awaitable[Any]]
+
+NOISE: float = 0.05  # Differences smaller than this share of the measured time are within run to run noise
+
+
+async def await_repeatedly(coroutine_function: CoroutineFunction, args: Args, repetitions: int) -> float:
+    started: float = time.perf_counter()
+    for _ in range(repetitions):
+        await coroutine_function(*args)
+
+    return time.perf_counter() - started
+
+
+async def gather_concurrently(coroutine_function: CoroutineFunction, args: Args, concurrency: int, rounds: int) -> float:
+    started: float = time.perf_counter()
+    for _ in range(rounds):
+        await asyncio.gather(*(coroutine_function(*args) for _ in range(concurrency)))
+
+    return time.perf_counter() - started
+
+
+def benchmark_coroutine(
+    test: Test[Any], coroutine_function: CoroutineFunction, concurrency: int, calibrate: bool = False
+) -> tuple[float, float | None, float, float | None]:
+    # Returns seconds per await, the same for an empty coroutine if calibrating, and tasks per second with and without the loop's
+    # scheduling cost, the last of which is None when the coroutine's own work is too small to tell apart from scheduling it
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()  # Reused for every measurement, so its setup cost isn't timed
+
+    try:
+        copied_args: Args = copy.deepcopy(test.args)
+        actual: Any = loop.run_until_complete(coroutine_function(*copied_args))
+
+        if not test.verify(actual, test.expected):
+            raise IncorrectOutput(test.expected, actual)
+
+        noop: CoroutineFunction = async_noop_with_arity(len(test.args))
+
+        latency: float = loop.run_until_complete(await_repeatedly(coroutine_function, copied_args, test.repetitions)) / test.repetitions
+        overhead: float | None = None
+        if calibrate:
+            overhead = loop.run_until_complete(await_repeatedly(noop, copied_args, test.repetitions)) / test.repetitions
+
+        rounds: int = max(test.repetitions // concurrency, 1)  # About as many tasks in total as there were awaits
+        concurrent_time: float = loop.run_until_complete(gather_concurrently(coroutine_function, copied_args, concurrency, rounds))
+        scheduling_time: float = loop.run_until_complete(gather_concurrently(noop, copied_args, concurrency, rounds))
+    finally:
+        loop.close()
+
+    tasks: int = concurrency * rounds
+    working_time: float = concurrent_time - scheduling_time
+
+    return latency, overhead, tasks / concurrent_time, tasks / working_time if working_time > NOISE * concurrent_time else None
@@ -0,0 +1,53 @@
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from .startup import IMPORT_END, IMPORT_START
+
+
+ModuleImport = tuple[str, float, float]  # Module, own and cumulative import time in seconds
+CallLatency = tuple[str, float, float]  # Implementation, first call and steady state call time in seconds
+
+
+@dataclass(slots=True)
+class ColdStart:
+    challenge: str
+    import_time: float
+
+    imports: list[ModuleImport]
+    calls: list[CallLatency]
+
+
+def parse_import_times(log: str) -> list[ModuleImport]:
+    # Lines look like `import time:       123 |        456 |   package.module`, with times in microseconds
+    imports: list[ModuleImport] = []
+    importing: bool = False
+
+    for line in log.splitlines():
+        if line == IMPORT_START:
+            importing = True
+        elif line == IMPORT_END:
+            break
+        elif importing and line.startswith('import time:') and not line.endswith('imported package'):
+            own, cumulative, module_name = line.removeprefix('import time:').split('|')
+
+            imports.append((module_name.strip(), int(own) / 1_000_000, int(cumulative) / 1_000_000))
+
+    return imports
+
+
+def measure_cold_start(challenge: str, module_name: str) -> ColdStart | None:
+    worker: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-m', 'benchmark.startup', module_name], capture_output=True, text=True
+    )
+
+    try:
+        measurements: dict = json.loads(worker.stdout)
+    except ValueError:
+        print(worker.stderr, file=sys.stderr)
+        return None
+
+    return ColdStart(
+        challenge, measurements['import_time'], parse_import_times(worker.stderr), [tuple(call) for call in measurements['calls']]  # type: ignore
+    )
@@ -0,0 +1,68 @@
+import contextlib
+import gc
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+
+GENERATIONS: int = 3
+
+
+@dataclass(slots=True)
+class CollectorActivity:
+    collections: list[int] = field(default_factory=lambda: [0] * GENERATIONS)
+    pauses: list[float] = field(default_factory=lambda: [0.0] * GENERATIONS)  # Total seconds spent collecting each generation
+
+    collection_started: float = 0.0
+    paused: bool = False  # While the harness itself is busy, like copying args, so its collections aren't blamed on the function
+
+    def on_collection(self, phase: str, info: dict[str, Any]):
+        if self.paused:
+            return
+
+        if phase == 'start':
+            self.collection_started = time.perf_counter()
+        else:
+            generation: int = info['generation']
+
+            self.collections[generation] += 1
+            self.pauses[generation] += time.perf_counter() - self.collection_started
+
+    @property
+    def total_pause(self) -> float:
+        return sum(self.pauses)
+
+    def __str__(self) -> str:
+        return ', '.join(
+            f'gen {generation}: {self.collections[generation]} collections taking {self.pauses[generation] * 1000:.6f} ms'
+            for generation in range(GENERATIONS)
+        )
+
+
+watching: list[CollectorActivity] = []
+
+
+@contextlib.contextmanager
+def watch_collector() -> Iterator[CollectorActivity]:
+    activity: CollectorActivity = CollectorActivity()
+
+    gc.callbacks.append(activity.on_collection)
+    watching.append(activity)
+    gc.enable()  # The rest of the harness keeps it disabled
+    try:
+        yield activity
+    finally:
+        gc.disable()
+        watching.remove(activity)
+        gc.callbacks.remove(activity.on_collection)
+
+
+@contextlib.contextmanager
+def unwatched() -> Iterator[None]:
+    for activity in watching:
+        activity.paused = True
+    try:
+        yield
+    finally:
+        for activity in watching:
+            activity.paused = False
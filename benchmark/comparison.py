@@ -0,0 +1,126 @@
+import gc
+import math
+import random
+import statistics
+import timeit
+from dataclasses import dataclass
+from typing import Any
+
+from .config import Args, Test, TestedFunction, timer
+
+
+@dataclass(slots=True)
+class Comparison:
+    challenge: str
+    case: int
+    baseline: str
+    candidate: str
+
+    baseline_time: float  # Median seconds per call
+    candidate_time: float
+    speedup: float  # How many times faster the candidate is
+    low: float  # Bounds of the speedup's confidence interval
+    high: float
+    p_value: float
+
+    def is_significant(self, alpha: float) -> bool:
+        return self.p_value < alpha and not self.low <= 1 <= self.high
+
+
+def interleaved_samples(
+    test: Test[Any], baseline: TestedFunction[Any], candidate: TestedFunction[Any], samples: int, rng: random.Random
+) -> tuple[list[float], list[float]]:
+    timers: list[timeit.Timer] = []
+    for tested_function in (baseline, candidate):
+        copied_args: Args = test.verified_args(tested_function)
+        timers.append(timer(lambda tested_function=tested_function, copied_args=copied_args: tested_function(*copied_args)))
+
+    order: list[int] = [0, 1] * samples
+    rng.shuffle(order)  # Interleaving in a random order spreads drift like frequency scaling evenly over both
+
+    timings: tuple[list[float], list[float]] = ([], [])
+    for which in order:
+        timings[which].append(timers[which].timeit(number=test.repetitions) / test.repetitions)
+
+    return timings
+
+
+def bootstrap_speedup(
+    baseline: list[float], candidate: list[float], rng: random.Random, confidence: float, rounds: int = 2000
+) -> tuple[float, float]:
+    speedups: list[float] = sorted(
+        statistics.median(rng.choices(baseline, k=len(baseline))) / statistics.median(rng.choices(candidate, k=len(candidate)))
+        for _ in range(rounds)
+    )
+
+    tail: float = (1 - confidence) / 2
+    return speedups[int(tail * (rounds - 1))], speedups[math.ceil((1 - tail) * (rounds - 1))]
+
+
+def mann_whitney_u(first: list[float], second: list[float]) -> float:
+    # Two-sided p-value, from the normal approximation with a correction for ties
+    ranked: list[tuple[float, int]] = sorted([(value, 0) for value in first] + [(value, 1) for value in second])
+    ranks: list[float] = [0.0] * len(ranked)
+    tie_correction: float = 0.0
+
+    start: int = 0
+    while start < len(ranked):
+        end: int = start
+        while end + 1 < len(ranked) and ranked[end + 1][0] == ranked[start][0]:
+            end += 1
+
+        for index in range(start, end + 1):
+            ranks[index] = (start + end) / 2 + 1
+
+        tied: int = end - start + 1
+        tie_correction += tied**3 - tied
+        start = end + 1
+
+    n1, n2 = len(first), len(second)
+    n: int = n1 + n2
+
+    u: float = sum(rank for rank, (_, group) in zip(ranks, ranked) if group == 0) - n1 * (n1 + 1) / 2
+    variance: float = n1 * n2 / 12 * ((n + 1) - tie_correction / (n * (n - 1)))
+
+    if variance == 0:
+        return 1.0
+
+    z: float = abs(u - n1 * n2 / 2) / math.sqrt(variance)
+    return 2 * (1 - statistics.NormalDist().cdf(z))
+
+
+def compare(
+    challenge: str,
+    case: int,
+    test: Test[Any],
+    baseline: tuple[str, TestedFunction[Any]],
+    candidate: tuple[str, TestedFunction[Any]],
+    samples: int,
+    confidence: float,
+    seed: int,
+) -> Comparison:
+    rng: random.Random = random.Random(seed)
+
+    try:
+        gc.disable()
+        baseline_times, candidate_times = interleaved_samples(test, baseline[1], candidate[1], samples, rng)
+    finally:
+        gc.enable()
+        gc.collect()
+
+    baseline_time: float = statistics.median(baseline_times)
+    candidate_time: float = statistics.median(candidate_times)
+    low, high = bootstrap_speedup(baseline_times, candidate_times, rng, confidence)
+
+    return Comparison(
+        challenge,
+        case,
+        baseline[0],
+        candidate[0],
+        baseline_time,
+        candidate_time,
+        baseline_time / candidate_time,
+        low,
+        high,
+        mann_whitney_u(baseline_times, candidate_times),
+    )
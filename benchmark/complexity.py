@@ -0,0 +1,58 @@
+import gc
+import math
+import statistics
+from dataclasses import dataclass
+from typing import Any
+
+from .config import Test, TestedFunction, TestProfile
+
+
+@dataclass(slots=True)
+class Growth:
+    challenge: str
+    implementation: str
+
+    sizes: list[int]
+    times: list[float]  # Seconds per call at each size
+
+    @property
+    def exponent(self) -> float:
+        # The slope of the log-log line is k in time ~ size**k
+        return statistics.linear_regression([math.log(size) for size in self.sizes], [math.log(max(time, 1e-12)) for time in self.times]).slope
+
+
+def accept_any(actual: Any, expected: Any) -> bool:
+    return True  # Generated cases have no known answer, checking them against each other is the fuzzer's job
+
+
+def geometric_sizes(min_size: int, max_size: int, factor: int) -> list[int]:
+    sizes: list[int] = []
+
+    size: int = min_size
+    while size <= max_size:
+        sizes.append(size)
+        size *= factor
+
+    return sizes
+
+
+def measure_growth(
+    test_profile: TestProfile[Any], challenge: str, title: str, sizes: list[int], seed: int, target_time: float, pool_size: int
+) -> Growth:
+    assert test_profile.generate is not None
+
+    tested_function: TestedFunction[Any] = dict(test_profile.functions)[title]
+    times: list[float] = []
+
+    for size in sizes:
+        test: Test[Any] = Test(1, test_profile.generate(size, seed), None, accept_any)
+
+        try:
+            gc.disable()
+            test.repetitions = test.autorange(tested_function, target_time, pool_size)
+            times.append(test.benchmark(tested_function, pool_size))  # Fresh args, as the generated inputs are meant to be used as they are
+        finally:
+            gc.enable()
+            gc.collect()
+
+    return Growth(challenge, title, sizes, times)
@@ -1,11 +1,23 @@
 import copy
+import cProfile
+import gc
 import importlib
+import itertools
+import json
+import math
+import os
+import re
+import sys
+import time
 import timeit
+import tracemalloc
 from dataclasses import dataclass
 from types import ModuleType
-from typing import Any, Callable, Generic, TypeVar
+from typing import Any, Awaitable, Callable, Generic, Iterable, Iterator, TypeVar
 
+from .collector import unwatched
 from .errors import IncorrectOutput
+from .histogram import Histogram
 
 
 T = TypeVar('T')
@@ -14,12 +26,33 @@ TestedFunction = Callable[..., T]
 Args = tuple[Any, ...]
 DisplayMethod = Callable[[T], str]
 VerifyMethod = Callable[[T, T], bool]
+GenerateMethod = Callable[[int, int], Args]  # Takes an input size and a random seed
 
 
 def default_verify(actual: T, expected: T) -> bool:
     return actual == expected
 
 
+def timer(statement: Callable[[], Any]) -> timeit.Timer:
+    # timeit always turns the collector off while timing, so turn it back on in the setup if the caller had it enabled
+    return timeit.Timer(statement, setup=gc.enable if gc.isenabled() else 'pass')
+
+
+def noop_with_arity(arity: int) -> TestedFunction[None]:
+    parameters: str = ', '.join(f'arg_{index}' for index in range(arity))
+
+    return eval(f'lambda {parameters}: None')  # A real signature, so calling it unpacks args exactly like the tested function
+
+
+def async_noop_with_arity(arity: int) -> Callable[..., Awaitable[None]]:
+    parameters: str = ', '.join(f'arg_{index}' for index in range(arity))
+    namespace: dict[str, Any] = {}
+
+    exec(f'async def noop({parameters}):\n    return None', namespace)  # Coroutines can't be lambdas
+
+    return namespace['noop']
+
+
 @dataclass(slots=True)
 class Test(Generic[T]):
     repetitions: int
@@ -35,14 +68,135 @@ class Test(Generic[T]):
 
         return self._verify(actual, expected)
 
-    def benchmark(self, tested_function: TestedFunction[T]) -> float:
-        copied_args = copy.deepcopy(self.args)  # Copy the args so that if the tested function mutates them, it won't mess up future tests.
-        actual: T = tested_function(*copied_args)
+    def verified_args(self, tested_function: TestedFunction[T]) -> Args:
+        with unwatched():  # Verifying isn't part of the timed calls
+            # Copy the args so that if the tested function mutates them, it won't mess up future tests.
+            copied_args = copy.deepcopy(self.args)
+            actual: T = tested_function(*copied_args)
 
         if not self.verify(actual, self.expected):
             raise IncorrectOutput[T](self.expected, actual)
 
-        return timeit.timeit(lambda: tested_function(*copied_args), number=self.repetitions) / self.repetitions
+        return copied_args
+
+    def fresh_args(self, tested_function: TestedFunction[T]) -> Args:
+        self.verified_args(tested_function)  # Only checks the output, as the verifying call may have mutated its own copy
+
+        return copy.deepcopy(self.args)
+
+    def fresh_pools(self, calls: int, pool_size: int) -> Iterator[list[Args]]:
+        for pool_start in range(0, calls, pool_size):
+            with unwatched():
+                pool: list[Args] = [copy.deepcopy(self.args) for _ in range(min(pool_size, calls - pool_start))]
+
+            yield pool
+
+    def call_args(self, tested_function: TestedFunction[T], calls: int, pool_size: int | None = None) -> Iterator[Iterable[Args]]:
+        if pool_size is None:  # Every call shares one copy
+            yield itertools.repeat(self.fresh_args(tested_function), calls)
+            return
+
+        self.verified_args(tested_function)
+        yield from self.fresh_pools(calls, pool_size)
+
+    def time_fresh(self, tested_function: TestedFunction[T], pool_size: int, repetitions: int | None = None) -> float:
+        total: float = 0.0
+
+        for pool in self.fresh_pools(repetitions or self.repetitions, pool_size):  # Copied outside the timed region
+            started: float = time.perf_counter()
+            for copied_args in pool:
+                tested_function(*copied_args)
+            total += time.perf_counter() - started
+
+        return total
+
+    def benchmark(self, tested_function: TestedFunction[T], pool_size: int | None = None) -> float:
+        copied_args: Args = self.verified_args(tested_function)
+
+        if pool_size is not None:  # Every call gets its own copy of the args, for functions that mutate them
+            return self.time_fresh(tested_function, pool_size) / self.repetitions
+
+        return timer(lambda: tested_function(*copied_args)).timeit(number=self.repetitions) / self.repetitions
+
+    def overhead(self, pool_size: int | None = None, rounds: int = 5) -> float:
+        noop: TestedFunction[None] = noop_with_arity(len(self.args))
+        copied_args: Args = copy.deepcopy(self.args)
+
+        # The fastest round is the closest to the harness's fixed cost, the rest only adds noise
+        if pool_size is not None:
+            return min(self.time_fresh(noop, pool_size) for _ in range(rounds)) / self.repetitions
+
+        return min(timer(lambda: noop(*copied_args)).repeat(number=self.repetitions, repeat=rounds)) / self.repetitions
+
+    def autorange(self, tested_function: TestedFunction[T], target_time: float, pool_size: int | None = None) -> int:
+        copied_args: Args = self.fresh_args(tested_function)
+        tested_timer: timeit.Timer = timer(lambda: tested_function(*copied_args))
+
+        repetitions: int = 1
+        while True:
+            elapsed: float
+            if pool_size is not None:
+                elapsed = self.time_fresh(tested_function, pool_size, repetitions)
+            else:
+                elapsed = tested_timer.timeit(number=repetitions)
+
+            if elapsed >= target_time / 10:  # Long enough to extrapolate from without the timer's resolution skewing it
+                return max(repetitions, math.ceil(repetitions * target_time / elapsed))
+
+            repetitions *= 10
+
+    def sample(self, tested_function: TestedFunction[T], samples: int, warmup: int, pool_size: int | None = None) -> list[float]:
+        copied_args: Args = self.verified_args(tested_function)
+
+        if pool_size is not None:
+            with unwatched():  # Warmup rounds are thrown away, and so are their collections
+                for _ in range(warmup):
+                    self.time_fresh(tested_function, pool_size)
+
+            return [self.time_fresh(tested_function, pool_size) / self.repetitions for _ in range(samples)]
+
+        tested_timer: timeit.Timer = timer(lambda: tested_function(*copied_args))
+
+        with unwatched():
+            tested_timer.repeat(repeat=warmup, number=self.repetitions)  # Warmup rounds are timed the same way, but thrown away
+
+        return [total / self.repetitions for total in tested_timer.repeat(repeat=samples, number=self.repetitions)]
+
+    def memory(self, tested_function: TestedFunction[T]) -> tuple[int, int]:
+        copied_args: Args = self.fresh_args(tested_function)
+
+        tracemalloc.start()
+        try:
+            baseline_memory, _ = tracemalloc.get_traced_memory()
+            baseline_blocks: int = sys.getallocatedblocks()
+
+            actual: T = tested_function(*copied_args)  # Kept alive until the blocks are counted, as it's part of the call's cost
+
+            allocated_blocks: int = sys.getallocatedblocks() - baseline_blocks
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        del actual
+        return peak_memory - baseline_memory, allocated_blocks
+
+    def profile(self, tested_function: TestedFunction[T], calls: int, pool_size: int | None = None) -> cProfile.Profile:
+        profiler: cProfile.Profile = cProfile.Profile()
+
+        for pool in self.call_args(tested_function, calls, pool_size):  # Only the calls are profiled, not copying the args
+            profiler.enable()
+            for copied_args in pool:
+                tested_function(*copied_args)
+            profiler.disable()
+
+        return profiler
+
+    def latency(self, tested_function: TestedFunction[T], histogram: Histogram, pool_size: int | None = None):
+        for pool in self.call_args(tested_function, self.repetitions, pool_size):
+            for copied_args in pool:
+                started: int = time.perf_counter_ns()
+                tested_function(*copied_args)
+                histogram.record(time.perf_counter_ns() - started)  # Bucketing happens outside the timed region
 
 
 @dataclass(slots=True)
@@ -51,6 +205,23 @@ class TestProfile(Generic[T]):
     cases: list[Test[T]]
 
     display: DisplayMethod[T]
+    generate: GenerateMethod | None = None
+    verify: VerifyMethod[T] = default_verify
+
+
+def project_name(module_name: str) -> str:
+    return module_name[module_name.rfind('-') + 1 :].replace('_', ' ')
+
+
+def case_file_name(module_name: str, implementation: str, case: int, extension: str) -> str:
+    return re.sub(r'[^\w.-]+', '_', f'{module_name}-{implementation or "implementation"}-case{case}') + extension
+
+
+def export_histogram(histogram: Histogram, directory: str, module_name: str, implementation: str, case: int):
+    os.makedirs(directory, exist_ok=True)
+
+    with open(os.path.join(directory, case_file_name(module_name, implementation, case, '.json')), 'w') as exported:
+        json.dump(histogram.to_json(), exported)
 
 
 def setup(module_name: str, repetitions: int) -> TestProfile[Any]:
@@ -74,4 +245,6 @@ def setup(module_name: str, repetitions: int) -> TestProfile[Any]:
     except AttributeError:
         display_method = str
 
-    return TestProfile(imported_functions, test_cases, display_method)
+    generate: GenerateMethod | None = getattr(module, 'generate_case', None)
+
+    return TestProfile(imported_functions, test_cases, display_method, generate, verify)
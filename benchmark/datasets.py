@@ -0,0 +1,120 @@
+import functools
+import glob
+import hashlib
+import inspect
+import mmap
+import os
+import pickle
+import re
+import struct
+import sys
+from types import ModuleType
+
+from .config import Args, GenerateMethod
+
+
+CACHE_VARIABLE: str = 'BENCHMARK_DATASET_CACHE'  # An environment variable, so worker processes share the setting
+DEFAULT_CACHE: str = '.benchmark_cache'
+
+# File layout: buffer count, then the length of the pickle and of every out-of-band buffer, then the pickle and the buffers
+COUNT: struct.Struct = struct.Struct('<Q')
+
+
+def cache_directory() -> str | None:
+    directory: str = os.environ.get(CACHE_VARIABLE, DEFAULT_CACHE)
+
+    return directory or None  # Set to an empty string to turn caching off
+
+
+@functools.cache
+def source_digest(generate: GenerateMethod) -> str:
+    # Hashing every file of the challenge the generator belongs to means editing any helper it calls from there, like tap code's
+    # codec, also invalidates its datasets. Helpers from outside the challenge aren't covered
+    challenge: ModuleType = sys.modules[generate.__module__.partition('.')[0]]
+
+    source_files: list[str]
+    if hasattr(challenge, '__path__'):
+        source_files = sorted(glob.glob(os.path.join(challenge.__path__[0], '**', '*.py'), recursive=True))
+    elif (source_file := inspect.getsourcefile(generate)) is not None:
+        source_files = [source_file]
+    else:
+        return 'unknown'
+
+    digest: hashlib._Hash = hashlib.sha256()
+    for source_file in source_files:
+        with open(source_file, 'rb') as source:
+            digest.update(source.read())
+
+    return digest.hexdigest()[:12]
+
+
+def dataset_path(directory: str, generate: GenerateMethod, size: int, seed: int) -> str:
+    name: str = f'{generate.__module__}.{generate.__qualname__}-{size}-{seed}-{source_digest(generate)}'
+
+    return os.path.join(directory, re.sub(r'[^\w.-]+', '_', name) + '.pickle')
+
+
+def save_dataset(path: str, args: Args):
+    buffers: list[pickle.PickleBuffer] = []
+    data: bytes = pickle.dumps(args, protocol=5, buffer_callback=buffers.append)  # Large binary buffers are kept out of the pickle stream
+    raw_buffers: list[memoryview] = [buffer.raw() for buffer in buffers]
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    temporary_path: str = f'{path}.{os.getpid()}.tmp'  # Written aside and then moved, so parallel workers never read half a file
+    with open(temporary_path, 'wb') as dataset:
+        dataset.write(COUNT.pack(len(raw_buffers)))
+        dataset.write(struct.pack(f'<{len(raw_buffers) + 1}Q', len(data), *(buffer.nbytes for buffer in raw_buffers)))
+        dataset.write(data)
+
+        for buffer in raw_buffers:
+            dataset.write(buffer)
+
+    os.replace(temporary_path, path)
+
+
+def load_dataset(path: str) -> Args:
+    with open(path, 'rb') as dataset:
+        mapped: mmap.mmap = mmap.mmap(dataset.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view: memoryview = memoryview(mapped)
+    (buffer_count,) = COUNT.unpack_from(view)
+    lengths: tuple[int, ...] = struct.unpack_from(f'<{buffer_count + 1}Q', view, COUNT.size)
+
+    slices: list[memoryview] = []
+    offset: int = COUNT.size + 8 * len(lengths)
+    for length in lengths:
+        slices.append(view[offset : offset + length])
+        offset += length
+
+    args: Args = pickle.loads(slices[0], buffers=slices[1:])  # Out-of-band buffers are read-only views straight into the mapping
+
+    slices[0].release()
+    if buffer_count == 0:  # Otherwise the mapping stays open for as long as the loaded buffers are alive
+        view.release()
+        mapped.close()
+
+    return args
+
+
+def cached(generate: GenerateMethod) -> GenerateMethod:
+    @functools.wraps(generate)
+    def generate_or_load(size: int, seed: int) -> Args:
+        directory: str | None = cache_directory()
+
+        if directory is None:
+            return generate(size, seed)
+
+        path: str = dataset_path(directory, generate, size, seed)
+
+        try:
+            return load_dataset(path)
+        except (OSError, ValueError, pickle.UnpicklingError, struct.error):  # Missing or unreadable, so build it again
+            pass
+
+        args: Args = generate(size, seed)
+        save_dataset(path, args)
+
+        return args
+
+    return generate_or_load
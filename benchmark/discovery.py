@@ -0,0 +1,45 @@
+import importlib
+import logging
+import os
+import pkgutil
+from types import ModuleType
+from typing import Iterator
+
+
+log = logging.getLogger(__name__)
+
+
+def candidate_modules(root: str) -> Iterator[str]:
+    for package in sorted(pkgutil.iter_modules([root]), key=lambda info: info.name):
+        if not package.ispkg:
+            continue
+
+        yield package.name
+
+        for submodule in sorted(pkgutil.iter_modules([os.path.join(root, package.name)]), key=lambda info: info.name):
+            if submodule.name != '__main__':  # Running a package's __main__ would start its CLI
+                yield f'{package.name}.{submodule.name}'
+
+
+def is_benchmarkable(module: ModuleType) -> bool:
+    return (hasattr(module, 'tested_function') or hasattr(module, 'tested_functions')) and hasattr(module, 'test_cases')
+
+
+def discover(root: str) -> list[str]:
+    module_names: list[str] = []
+    seen_test_cases: set[int] = set()  # Packages often re-export a submodule's cases, which shouldn't be benchmarked twice
+
+    for module_name in candidate_modules(root):
+        try:
+            module: ModuleType = importlib.import_module(module_name)
+        except Exception as e:
+            log.warning('Skipping %s, as it could not be imported', module_name, exc_info=e)
+            continue
+
+        if not is_benchmarkable(module) or id(module.test_cases) in seen_test_cases:
+            continue
+
+        seen_test_cases.add(id(module.test_cases))
+        module_names.append(module_name)
+
+    return module_names
@@ -0,0 +1,118 @@
+import inspect
+import reprlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from .config import Args, TestedFunction, TestProfile
+from .runner import load_profile
+
+
+BASELINE: str = 'proper'
+
+short_repr: reprlib.Repr = reprlib.Repr()
+short_repr.maxstring = short_repr.maxother = 120
+short_repr.maxlist = short_repr.maxtuple = 8
+
+
+@dataclass(slots=True)
+class Divergence:
+    seed: int
+    implementation: str
+    reference: str
+
+    args: str  # Shortened reprs, as generated inputs can be huge
+    expected: str
+    actual: str
+
+
+@dataclass(slots=True)
+class FuzzReport:
+    challenge: str
+    size: int
+    inputs: int
+    wall_time: float
+
+    busy_time: dict[str, float] = field(default_factory=dict)  # Seconds each implementation spent on all the inputs
+    divergence: Divergence | None = None
+
+
+@dataclass(slots=True)
+class Raised:
+    description: str  # Exceptions are compared by their repr, as they don't compare equal to each other
+
+
+def run_generated(module_name: str, repetitions: int, title: str, size: int, seed: int) -> tuple[Any, float]:
+    test_profile: TestProfile[Any] = load_profile(module_name, repetitions)
+    assert test_profile.generate is not None
+
+    tested_function: TestedFunction[Any] = dict(test_profile.functions)[title]
+    args: Args = test_profile.generate(size, seed)  # Rebuilt in the worker, so huge inputs never need pickling
+
+    started: float = time.perf_counter()
+    try:
+        output: Any = tested_function(*args)
+    except Exception as e:
+        output = Raised(repr(e))
+
+    return output, time.perf_counter() - started
+
+
+def reference_implementation(titles: list[str]) -> str:
+    return next((title for title in titles if title.lower() == BASELINE), titles[0])
+
+
+def fuzz(challenge: str, module_name: str, repetitions: int, size: int, inputs: int, seed: int, jobs: int) -> FuzzReport:
+    test_profile: TestProfile[Any] = load_profile(module_name, repetitions)
+    assert test_profile.generate is not None
+
+    titles: list[str] = [title for title, function in test_profile.functions if not inspect.iscoroutinefunction(function)]
+    reference: str = reference_implementation(titles)
+    runs: list[tuple[str, int]] = [(title, input_seed) for input_seed in range(seed, seed + inputs) for title in titles]
+
+    report: FuzzReport = FuzzReport(challenge, size, inputs, 0.0, {title: 0.0 for title in titles})
+
+    started: float = time.perf_counter()
+    with ProcessPoolExecutor(jobs) as executor:
+        outcomes: list[tuple[Any, float]] = list(
+            executor.map(
+                run_generated,
+                [module_name] * len(runs),
+                [repetitions] * len(runs),
+                [title for title, _ in runs],
+                [size] * len(runs),
+                [input_seed for _, input_seed in runs],
+                chunksize=max(len(runs) // (jobs * 4), 1),
+            )
+        )
+    report.wall_time = time.perf_counter() - started
+
+    outputs: dict[tuple[str, int], Any] = {}
+    for (title, input_seed), (output, elapsed) in zip(runs, outcomes):
+        outputs[(title, input_seed)] = output
+        report.busy_time[title] += elapsed
+
+    for input_seed in range(seed, seed + inputs):  # In seed order, so the first divergence found is the earliest one
+        expected: Any = outputs[(reference, input_seed)]
+
+        for title in titles:
+            actual: Any = outputs[(title, input_seed)]
+
+            if isinstance(actual, Raised) or isinstance(expected, Raised):
+                same: bool = actual == expected
+            else:
+                same = test_profile.verify(actual, expected)
+
+            if not same:
+                report.divergence = Divergence(
+                    input_seed,
+                    title,
+                    reference,
+                    short_repr.repr(test_profile.generate(size, input_seed)),
+                    short_repr.repr(expected),
+                    short_repr.repr(actual),
+                )
+                return report
+
+    return report
@@ -0,0 +1,99 @@
+import json
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Self
+
+
+@dataclass(slots=True)
+class Histogram:
+    # Log-bucketed like an HDR histogram: every power of two is split into 2**sub_bucket_bits equal buckets,
+    # so each value is stored with the same relative precision (about 6% with the default 4 bits)
+    sub_bucket_bits: int = 4
+    counts: dict[int, int] = field(default_factory=dict)
+
+    def bucket_index(self, value: int) -> int:
+        magnitude: int = max(value.bit_length() - self.sub_bucket_bits - 1, 0)
+
+        return (magnitude << self.sub_bucket_bits) + (value >> magnitude)
+
+    def bucket_bounds(self, index: int) -> tuple[int, int]:
+        magnitude: int = max((index >> self.sub_bucket_bits) - 1, 0)
+        low: int = (index - (magnitude << self.sub_bucket_bits)) << magnitude
+
+        return low, low + (1 << magnitude)
+
+    def record(self, value: int):
+        index: int = self.bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+
+    def merge(self, other: Self):
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError('Only histograms with the same precision can be merged!')
+
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def percentile(self, percent: float) -> float:
+        target: float = self.total * percent / 100
+        seen: int = 0
+
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+
+            if seen >= target:
+                low, high = self.bucket_bounds(index)
+                return (low + high - 1) / 2
+
+        return 0.0
+
+    def to_json(self) -> dict[str, Any]:
+        return {'sub_bucket_bits': self.sub_bucket_bits, 'counts': {str(index): count for index, count in self.counts.items()}}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        return cls(data['sub_bucket_bits'], {int(index): count for index, count in data['counts'].items()})
+
+    def describe(self, width: int = 40, rows_per_magnitude: int = 4) -> str:
+        # Bars are coarser than the buckets, the full precision is only needed for percentiles and exports
+        shift: int = self.sub_bucket_bits - rows_per_magnitude.bit_length() + 1
+
+        rows: dict[int, int] = {}
+        for index, count in self.counts.items():
+            rows[index >> shift] = rows.get(index >> shift, 0) + count
+
+        largest: int = max(rows.values(), default=0)
+        lines: list[str] = [
+            '    '
+            + ', '.join(f'p{percent} {self.percentile(percent) / 1000:.3f} us' for percent in (50, 90, 99, 99.9))
+            + f' over {self.total} calls'
+        ]
+
+        for row in range(min(rows, default=0), max(rows, default=-1) + 1):
+            count: int = rows.get(row, 0)
+            low, _ = self.bucket_bounds(row << shift)
+
+            lines.append(f'    {low / 1000:>12.3f} us | {"#" * round(count / largest * width):<{width}} {count}')
+
+        return '\n'.join(lines)
+
+
+if __name__ == '__main__':  # Merge histograms exported by --histogram-dir, for example from several runs of the same case
+    merged: Histogram | None = None
+
+    for path in sys.argv[1:]:
+        with open(path) as exported:
+            histogram: Histogram = Histogram.from_json(json.load(exported))
+
+        if merged is None:
+            merged = histogram
+        else:
+            merged.merge(histogram)
+
+    if merged is None:
+        print('Usage: `python -m benchmark.histogram <histogram.json>...`')
+    else:
+        print(merged.describe())
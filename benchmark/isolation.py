@@ -0,0 +1,70 @@
+import argparse
+import contextlib
+import json
+import os
+import queue
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+
+from .config import project_name
+from .parallel import available_cores
+from .runner import Result, Task, run_task
+
+
+def run_isolated_task(task: Task, arguments: argparse.Namespace, core: int | None = None) -> Result:
+    request: dict[str, Any] = {
+        'task': [task.module_name, task.implementation, task.case, task.block],
+        'arguments': vars(arguments),
+        'core': core,
+    }
+
+    worker: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, '-m', 'benchmark.isolation'], input=json.dumps(request), stdout=subprocess.PIPE, text=True
+    )
+
+    try:
+        return Result.from_json(json.loads(worker.stdout))
+    except ValueError:  # The worker died before it could report back, and its traceback has already gone to stderr
+        return Result(
+            project_name(task.module_name),
+            task.implementation,
+            task.case,
+            error=f'Failure! Worker process exited with code {worker.returncode}.',
+        )
+
+
+def run_isolated(tasks: list[Task], arguments: argparse.Namespace, jobs: int) -> Iterator[Result]:
+    if jobs <= 1:
+        for task in tasks:
+            yield run_isolated_task(task, arguments)
+
+        return
+
+    free_cores: queue.SimpleQueue[int] = queue.SimpleQueue()
+    for core in available_cores():
+        free_cores.put(core)
+
+    def run_on_free_core(task: Task) -> Result:
+        core: int = free_cores.get()
+
+        try:
+            return run_isolated_task(task, arguments, core)
+        finally:
+            free_cores.put(core)
+
+    with ThreadPoolExecutor(min(jobs, len(available_cores()))) as executor:  # Threads only wait on the worker processes
+        yield from executor.map(run_on_free_core, tasks)
+
+
+if __name__ == '__main__':
+    request: dict[str, Any] = json.load(sys.stdin)
+
+    if request['core'] is not None and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {request['core']})
+
+    with contextlib.redirect_stdout(sys.stderr):  # Keep stdout clean for the result, even if the tested function prints
+        result: Result = run_task(Task(*request['task']), argparse.Namespace(**request['arguments']))
+
+    json.dump(result.to_json(), sys.stdout)
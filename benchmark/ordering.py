@@ -0,0 +1,76 @@
+import dataclasses
+import random
+import statistics
+from collections import defaultdict
+
+from .collector import GENERATIONS, CollectorActivity
+from .histogram import Histogram
+from .runner import Result, Task
+from .stats import Summary
+
+
+def shuffled_schedule(tasks: list[Task], blocks: int, seed: int) -> list[Task]:
+    schedule: list[Task] = [dataclasses.replace(task, block=block) for task in tasks for block in range(1, blocks + 1)]
+    random.Random(seed).shuffle(schedule)  # So frequency scaling and warm caches favour no implementation, case or block in particular
+
+    return schedule
+
+
+def merge_blocks(blocks: list[Result], median: bool) -> Result:
+    failed: list[Result] = [result for result in blocks if result.error is not None]
+    if failed:
+        return failed[0]
+
+    if len(blocks) == 1:
+        return blocks[0]
+
+    first: Result = blocks[0]
+    merged: Result = Result(first.challenge, first.implementation, first.case)
+
+    # Every block counts as one sample, so the summary shows how much the blocks disagree
+    merged.summary = Summary.from_samples([result.time for result in blocks])
+    merged.repetitions = round(statistics.fmean(result.repetitions for result in blocks))
+
+    if median:
+        merged.time = merged.summary.median
+    else:
+        merged.time = sum(result.time * result.repetitions for result in blocks) / sum(result.repetitions for result in blocks)
+
+    if first.overhead is not None:
+        merged.overhead = statistics.fmean(result.overhead for result in blocks)
+
+    if first.peak_memory is not None:
+        merged.peak_memory = max(result.peak_memory for result in blocks)
+        merged.allocated_blocks = first.allocated_blocks
+
+    if first.histogram is not None:
+        merged.histogram = Histogram(first.histogram.sub_bucket_bits)
+
+        for result in blocks:
+            merged.histogram.merge(result.histogram)
+
+    if first.collector is not None:
+        merged.collector = CollectorActivity(
+            [sum(result.collector.collections[generation] for result in blocks) for generation in range(GENERATIONS)],
+            [sum(result.collector.pauses[generation] for result in blocks) for generation in range(GENERATIONS)],
+        )
+
+    if first.tasks_per_second is not None:
+        merged.concurrency = first.concurrency
+        merged.tasks_per_second = statistics.fmean(result.tasks_per_second for result in blocks)
+
+        if all(result.scheduled_tasks_per_second is not None for result in blocks):
+            merged.scheduled_tasks_per_second = statistics.fmean(result.scheduled_tasks_per_second for result in blocks)
+
+    merged.hot_functions = first.hot_functions  # Profiles of different blocks can't be told apart anyway
+
+    return merged
+
+
+def regroup(tasks: list[Task], schedule: list[Task], results: list[Result], median: bool) -> list[Result]:
+    blocks: defaultdict[Task, list[tuple[int, Result]]] = defaultdict(list)
+
+    for scheduled, result in zip(schedule, results):
+        blocks[dataclasses.replace(scheduled, block=1)].append((scheduled.block, result))
+
+    return [merge_blocks([result for _, result in sorted(blocks[task], key=lambda block: block[0])], median) for task in tasks]
@@ -0,0 +1,41 @@
+import argparse
+import itertools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.sharedctypes import Synchronized
+from typing import Iterator
+
+from .runner import Result, Task, run_task
+
+
+log = logging.getLogger(__name__)
+
+
+def pin_to_core(cores: list[int], worker_counter: Synchronized) -> None:
+    with worker_counter.get_lock():
+        worker_id: int = worker_counter.value
+        worker_counter.value += 1
+
+    if hasattr(os, 'sched_setaffinity'):  # Only available on Linux, elsewhere the OS scheduler decides
+        os.sched_setaffinity(0, {cores[worker_id % len(cores)]})
+
+
+def available_cores() -> list[int]:
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    else:
+        return list(range(os.cpu_count() or 1))
+
+
+def run_parallel(tasks: list[Task], arguments: argparse.Namespace, jobs: int) -> Iterator[Result]:
+    cores: list[int] = available_cores()
+    if jobs > len(cores):  # Two workers sharing a core would slow each other down
+        log.warning('Capping --jobs at %d, the number of available cores', len(cores))
+        jobs = len(cores)
+
+    worker_counter: Synchronized = multiprocessing.Value('i', 0)
+
+    with ProcessPoolExecutor(jobs, initializer=pin_to_core, initargs=(cores, worker_counter)) as executor:
+        yield from executor.map(run_task, tasks, itertools.repeat(arguments))  # map yields in submission order
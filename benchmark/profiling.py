@@ -0,0 +1,46 @@
+import cProfile
+import os
+import pstats
+
+from .config import case_file_name
+
+
+HotFunction = tuple[str, int, float, float]  # Function, calls, own time and cumulative time, both in seconds per profiled call
+
+
+def function_name(file_name: str, line: int, name: str) -> str:
+    if file_name == '~':  # Built-ins have no source location
+        return name
+
+    return f'{os.path.basename(file_name)}:{line}({name})'
+
+
+def hot_functions(profiler: cProfile.Profile, calls: int, top: int) -> list[HotFunction]:
+    stats: dict = pstats.Stats(profiler).stats  # type: ignore
+
+    functions: list[HotFunction] = [
+        (function_name(*function), call_count, own_time / calls, cumulative_time / calls)
+        for function, (_, call_count, own_time, cumulative_time, _) in stats.items()
+        if "'_lsprof.Profiler'" not in function[2]  # Stopping the profiler is recorded too
+    ]
+
+    return sorted(functions, key=lambda hot_function: hot_function[2], reverse=True)[:top]
+
+
+def describe_hot_functions(functions: list[HotFunction]) -> str:
+    lines: list[str] = ['    own (ms)     cumulative (ms)  calls      function']
+    lines += [
+        f'    {own_time * 1000:<12.6f} {cumulative_time * 1000:<16.6f} {call_count:<10} {name}'
+        for name, call_count, own_time, cumulative_time in functions
+    ]
+
+    return '\n'.join(lines)
+
+
+def dump_stats(profiler: cProfile.Profile, directory: str, module_name: str, implementation: str, case: int) -> str:
+    path: str = os.path.join(directory, case_file_name(module_name, implementation, case, '.pstats'))
+
+    os.makedirs(directory, exist_ok=True)
+    profiler.dump_stats(path)
+
+    return path
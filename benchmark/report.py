@@ -0,0 +1,187 @@
+from .coldstart import ColdStart
+from .comparison import Comparison
+from .complexity import Growth
+from .fuzzing import FuzzReport
+from .runner import Result
+from .store import Record
+from .throughput import Throughput
+
+
+BASELINE: str = 'proper'
+
+
+def format_table(header: list[str], rows: list[list[str]]) -> str:
+    widths: list[int] = [max(len(row[column]) for row in [header, *rows]) for column in range(len(header))]
+
+    lines: list[str] = [' | '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in [header, *rows]]
+    lines.insert(1, '-+-'.join('-' * width for width in widths))
+
+    return '\n'.join(lines)
+
+
+def baseline_times(results: list[Result]) -> dict[tuple[str, int], float]:
+    return {
+        (result.challenge, result.case): result.time
+        for result in results
+        if result.implementation.lower() == BASELINE and result.time is not None
+    }
+
+
+def summary_table(results: list[Result]) -> str:
+    baselines: dict[tuple[str, int], float] = baseline_times(results)
+    show_collector: bool = any(result.collector is not None for result in results)
+    show_calibrated: bool = any(result.overhead is not None for result in results)
+    show_memory: bool = any(result.peak_memory is not None for result in results)
+    rows: list[list[str]] = []
+
+    for result in results:
+        baseline: float | None = baselines.get((result.challenge, result.case))
+
+        if result.time is None:
+            time, speedup = 'failed', '-'
+        else:
+            time = f'{result.time * 1000:.6f}'
+            speedup = f'{baseline / result.time:.2f}x' if baseline is not None else '-'
+
+        row: list[str] = [result.challenge, result.implementation or '-', str(result.case), time, speedup]
+
+        if show_calibrated:
+            row.append(f'{result.calibrated_time * 1000:.6f}' if result.calibrated_time is not None else '-')
+
+        if show_collector:
+            row.append(f'{result.collector.total_pause * 1000:.6f}' if result.collector is not None else '-')
+
+        if show_memory:
+            row += [
+                str(result.peak_memory) if result.peak_memory is not None else '-',
+                str(result.allocated_blocks) if result.allocated_blocks is not None else '-',
+            ]
+
+        rows.append(row)
+
+    header: list[str] = ['challenge', 'implementation', 'case', 'time (ms)', f'speedup vs {BASELINE}']
+    if show_calibrated:
+        header.append('calibrated (ms)')
+
+    if show_collector:
+        header.append('gc pauses (ms)')
+
+    if show_memory:
+        header += ['peak memory (B)', 'blocks kept']
+
+    return format_table(header, rows)
+
+
+def regression_table(regressions: list[tuple[Record, Record]]) -> str:
+    rows: list[list[str]] = [
+        [
+            current.challenge,
+            current.implementation or '-',
+            str(current.case),
+            f'{baseline.time * 1000:.6f}',
+            f'{current.time * 1000:.6f}',
+            f'{(current.time / baseline.time - 1) * 100:+.1f}%',
+        ]
+        for baseline, current in regressions
+    ]
+
+    return format_table(['challenge', 'implementation', 'case', 'baseline (ms)', 'current (ms)', 'change'], rows)
+
+
+def growth_table(growths: list[Growth]) -> str:
+    sizes: list[int] = growths[0].sizes
+    rows: list[list[str]] = [
+        [growth.challenge, growth.implementation or '-', *(f'{time * 1000:.6f}' for time in growth.times), f'{growth.exponent:.2f}']
+        for growth in growths
+    ]
+
+    return format_table(['challenge', 'implementation', *(f'n={size} (ms)' for size in sizes), 'exponent'], rows)
+
+
+def comparison_table(comparisons: list[Comparison], confidence: float, alpha: float) -> str:
+    rows: list[list[str]] = [
+        [
+            comparison.challenge,
+            str(comparison.case),
+            f'{comparison.baseline_time * 1000:.6f}',
+            f'{comparison.candidate_time * 1000:.6f}',
+            f'{comparison.speedup:.2f}x',
+            f'{comparison.low:.2f}x - {comparison.high:.2f}x',
+            f'{comparison.p_value:.4f}',
+            'significant' if comparison.is_significant(alpha) else 'not distinguishable from noise',
+        ]
+        for comparison in comparisons
+    ]
+
+    baseline, candidate = comparisons[0].baseline, comparisons[0].candidate
+    return format_table(
+        ['challenge', 'case', f'{baseline} (ms)', f'{candidate} (ms)', 'speedup', f'{confidence:.0%} interval', 'p-value', 'verdict'], rows
+    )
+
+
+def throughput_table(throughputs: list[Throughput]) -> str:
+    # Efficiency compares each worker's rate to a single worker's, so 100% means perfectly linear scaling
+    single_worker: dict[tuple[str, str, int, str], float] = {}
+    for throughput in sorted(throughputs, key=lambda throughput: throughput.workers, reverse=True):
+        single_worker[(throughput.challenge, throughput.implementation, throughput.case, throughput.executor)] = (
+            throughput.calls_per_second / throughput.workers
+        )
+
+    rows: list[list[str]] = [
+        [
+            throughput.challenge,
+            throughput.implementation or '-',
+            str(throughput.case),
+            throughput.executor,
+            str(throughput.workers),
+            f'{throughput.calls_per_second:.0f}',
+            f'{throughput.calls_per_second / throughput.workers / single_worker[(throughput.challenge, throughput.implementation, throughput.case, throughput.executor)]:.0%}',
+        ]
+        for throughput in throughputs
+    ]
+
+    return format_table(['challenge', 'implementation', 'case', 'executor', 'workers', 'calls/s', 'efficiency'], rows)
+
+
+def cold_start_tables(cold_start: ColdStart, top: int) -> str:
+    slowest_imports: list[list[str]] = [
+        [module_name, f'{own * 1000:.3f}', f'{cumulative * 1000:.3f}']
+        for module_name, own, cumulative in sorted(cold_start.imports, key=lambda module_import: module_import[1], reverse=True)[:top]
+    ]
+    calls: list[list[str]] = [
+        [implementation or '-', f'{first * 1000:.6f}', f'{steady * 1000:.6f}', f'{first / steady:.1f}x']
+        for implementation, first, steady in cold_start.calls
+    ]
+
+    return '\n\n'.join(
+        [
+            f'=== Cold start of {cold_start.challenge}: imported in {cold_start.import_time * 1000:.3f} ms ===',
+            format_table(['module', 'own import (ms)', 'cumulative import (ms)'], slowest_imports),
+            format_table(['implementation', 'first call (ms)', 'steady state (ms)', 'first / steady'], calls),
+        ]
+    )
+
+
+def fuzz_summary(report: FuzzReport) -> str:
+    rows: list[list[str]] = [
+        [title or '-', f'{busy_time * 1000:.3f}', f'{report.inputs / busy_time:.1f}' if busy_time else '-']
+        for title, busy_time in report.busy_time.items()
+    ]
+    lines: list[str] = [
+        f'=== Fuzzed {report.challenge} with {report.inputs} inputs of size {report.size} in {report.wall_time:.3f} s '
+        f'({report.inputs / report.wall_time:.1f} inputs/s across all workers) ===',
+        format_table(['implementation', 'busy time (ms)', 'inputs/s'], rows),
+    ]
+
+    if report.divergence is None:
+        lines.append('Every implementation agreed on every input.')
+    else:
+        divergence = report.divergence
+        lines += [
+            f'{divergence.implementation or "The implementation"} diverged from {divergence.reference} first on the input from seed {divergence.seed}:',
+            f'Input: {divergence.args}',
+            f'Expected: {divergence.expected}',
+            f'Actual: {divergence.actual}',
+        ]
+
+    return '\n'.join(lines)
@@ -0,0 +1,226 @@
+import argparse
+import contextlib
+import cProfile
+import functools
+import gc
+import inspect
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Iterator, Self
+
+from .asynchronous import benchmark_coroutine
+from .collector import CollectorActivity, watch_collector
+from .config import Test, TestedFunction, TestProfile, export_histogram, project_name, setup
+from .datasets import cached
+from .errors import IncorrectOutput
+from .histogram import Histogram
+from .profiling import HotFunction, describe_hot_functions, dump_stats, hot_functions
+from .stats import Summary
+
+
+log = logging.getLogger(__name__)
+
+COROUTINE_UNSUPPORTED: tuple[str, ...] = ('autorange', 'stats', 'fresh_args', 'gc', 'memory', 'latency', 'profile')
+
+
+@dataclass(slots=True, frozen=True)
+class Task:
+    module_name: str
+    implementation: str
+    case: int
+    block: int = 1  # Which share of the repetitions, when they are split into blocks to shuffle
+
+
+@dataclass(slots=True)
+class Result:
+    challenge: str
+    implementation: str
+    case: int
+
+    time: float | None = None  # Seconds per call, or None if the test failed
+    repetitions: int = 0
+    summary: Summary | None = None
+    overhead: float | None = None  # Seconds per call spent in the harness rather than the tested function
+    peak_memory: int | None = None  # Bytes
+    allocated_blocks: int | None = None  # Blocks still allocated when the call returns, i.e. its result
+    hot_functions: list[HotFunction] | None = None
+    histogram: Histogram | None = None  # Nanoseconds per call
+    collector: CollectorActivity | None = None
+    concurrency: int | None = None  # How many coroutines ran at once for the tasks per second figures
+    tasks_per_second: float | None = None
+    scheduled_tasks_per_second: float | None = None  # Excluding the event loop's own cost of scheduling that many tasks
+    error: str | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        data: dict[str, Any] = asdict(self)
+        data['histogram'] = self.histogram.to_json() if self.histogram is not None else None  # Its counts have int keys
+
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        summary: dict[str, Any] | None = data.pop('summary')
+        histogram: dict[str, Any] | None = data.pop('histogram')
+        collector: dict[str, Any] | None = data.pop('collector')
+
+        return cls(
+            **data,
+            summary=Summary(**summary) if summary is not None else None,
+            histogram=Histogram.from_json(histogram) if histogram is not None else None,
+            collector=CollectorActivity(**collector) if collector is not None else None,
+        )
+
+    @property
+    def calibrated_time(self) -> float | None:
+        if self.time is None or self.overhead is None:
+            return None
+
+        return max(self.time - self.overhead, 0.0)
+
+    def describe(self, autoranged: bool) -> str:
+        if self.error is not None:
+            return self.error
+
+        description: str
+        if self.summary is not None:
+            description = f'Success! {self.summary} over {self.summary.count} samples of {self.repetitions} calls.'
+        elif autoranged:
+            description = f'Success! Took {self.time * 1000} ms on average over {self.repetitions} calls to complete!'
+        else:
+            description = f'Success! Took {self.time * 1000} ms on average to complete!'
+
+        if self.calibrated_time is not None:
+            description += f' Calibrated: {self.calibrated_time * 1000} ms after subtracting {self.overhead * 1000} ms of call overhead.'
+
+        if self.tasks_per_second is not None:
+            scheduled: str = f'{self.scheduled_tasks_per_second:.0f}' if self.scheduled_tasks_per_second is not None else 'not measurable'
+            description += (
+                f' {self.tasks_per_second:.0f} tasks/second with {self.concurrency} running at once,'
+                f' {scheduled} without the event loop\'s scheduling cost.'
+            )
+
+        if self.collector is not None:
+            description += f' Garbage collector: {self.collector}.'
+
+        if self.peak_memory is not None:
+            description += f' Peak memory {self.peak_memory} bytes, {self.allocated_blocks} blocks still allocated after the call.'
+
+        if self.histogram is not None:
+            description += f'\n{self.histogram.describe()}'
+
+        if self.hot_functions is not None:
+            description += f'\n{describe_hot_functions(self.hot_functions)}'
+
+        return description
+
+
+def measure(result: Result, task: Task, test: Test[Any], tested_function: TestedFunction[Any], arguments: argparse.Namespace):
+    if inspect.iscoroutinefunction(tested_function):  # Coroutines get their own event loop based measurements instead
+        unsupported: list[str] = [
+            f'--{option.replace("_", "-")}' for option in COROUTINE_UNSUPPORTED if getattr(arguments, option) not in (None, False)
+        ]
+
+        if unsupported:
+            result.error = f'Failure! {", ".join(unsupported)} can not be used with coroutine implementations.'
+            return
+
+        result.time, result.overhead, result.tasks_per_second, result.scheduled_tasks_per_second = benchmark_coroutine(
+            test, tested_function, arguments.concurrency, arguments.calibrate
+        )
+        result.repetitions, result.concurrency = test.repetitions, arguments.concurrency
+
+        return
+
+    pool_size: int | None = arguments.pool_size if arguments.fresh_args else None
+
+    if arguments.autorange is not None:
+        test.repetitions = test.autorange(tested_function, arguments.autorange, pool_size)
+
+    with contextlib.ExitStack() as timing:
+        if arguments.gc:  # Only the timed calls pay for collections, like they would in production
+            result.collector = timing.enter_context(watch_collector())
+
+        if arguments.stats:
+            result.summary = Summary.from_samples(test.sample(tested_function, arguments.samples, arguments.warmup, pool_size))
+            result.time = result.summary.median
+        else:
+            result.time = test.benchmark(tested_function, pool_size)
+
+    result.repetitions = test.repetitions
+
+    if arguments.calibrate:
+        result.overhead = test.overhead(pool_size)
+
+    if arguments.memory:  # Measured separately, as tracing allocations slows the timed calls down
+        result.peak_memory, result.allocated_blocks = test.memory(tested_function)
+
+    if arguments.latency:
+        result.histogram = Histogram()
+        test.latency(tested_function, result.histogram, pool_size)
+
+        if arguments.histogram_dir is not None:
+            export_histogram(result.histogram, arguments.histogram_dir, task.module_name, task.implementation, task.case)
+
+    if arguments.profile:
+        profiler: cProfile.Profile = test.profile(tested_function, arguments.profile_calls, pool_size)
+        result.hot_functions = hot_functions(profiler, arguments.profile_calls, arguments.profile_top)
+
+        if arguments.profile_dir is not None:
+            dump_stats(profiler, arguments.profile_dir, task.module_name, task.implementation, task.case)
+
+
+def run_case(test_profile: TestProfile[Any], task: Task, arguments: argparse.Namespace) -> Result:
+    tested_function: TestedFunction[Any] = dict(test_profile.functions)[task.implementation]
+    test: Test[Any] = test_profile.cases[task.case - 1]
+
+    result: Result = Result(project_name(task.module_name), task.implementation, task.case)
+
+    try:
+        gc.disable()
+        measure(result, task, test, tested_function, arguments)
+    except IncorrectOutput as output:
+        output = output.format(test_profile.display)
+        result.error = '\n'.join(
+            ['Failure! Unexpected output.', 'Input:', *map(str, test.args), 'Expected:', output.expected, 'Actual:', output.actual]
+        )
+    except Exception as e:
+        result.error = 'Failure! Raised an exception.'
+        log.error('Showing exception', exc_info=e)
+    finally:
+        gc.enable()
+        gc.collect()
+
+    return result
+
+
+@functools.cache
+def load_profile(module_name: str, repetitions: int) -> TestProfile[Any]:
+    test_profile: TestProfile[Any] = setup(module_name, repetitions)
+
+    if test_profile.generate is not None:
+        test_profile.generate = cached(test_profile.generate)
+
+    return test_profile
+
+
+def plan_tasks(module_names: list[str], repetitions: int) -> list[Task]:
+    tasks: list[Task] = []
+
+    for module_name in module_names:
+        test_profile: TestProfile[Any] = load_profile(module_name, repetitions)
+
+        for title, _ in test_profile.functions:
+            tasks += [Task(module_name, title, case_id) for case_id in range(1, len(test_profile.cases) + 1)]
+
+    return tasks
+
+
+def run_task(task: Task, arguments: argparse.Namespace) -> Result:
+    test_profile: TestProfile[Any] = load_profile(task.module_name, arguments.test_repetitions)
+
+    return run_case(test_profile, task, arguments)
+
+
+def run_serial(tasks: list[Task], arguments: argparse.Namespace) -> Iterator[Result]:
+    for task in tasks:
+        yield run_task(task, arguments)
@@ -0,0 +1,52 @@
+import sys
+import time
+
+
+# Only modules Python has already loaded by the time it runs this file are imported up here,
+# so that everything the challenge imports is charged to the challenge, not to the harness
+
+IMPORT_START: str = 'benchmark.startup: importing'
+IMPORT_END: str = 'benchmark.startup: imported'
+
+
+def measure_startup(module_name: str) -> dict:
+    import copy
+    import importlib
+
+    print(IMPORT_START, file=sys.stderr, flush=True)
+    started: float = time.perf_counter()
+    module = importlib.import_module(module_name)
+    import_time: float = time.perf_counter() - started
+    print(IMPORT_END, file=sys.stderr, flush=True)
+
+    functions: list = [('', module.tested_function)] if hasattr(module, 'tested_function') else module.tested_functions
+    args: tuple = module.test_cases[0][0]
+
+    first_calls: list[float] = []
+    for _, tested_function in functions:
+        copied_args: tuple = copy.deepcopy(args)  # So a function that mutates its input can't change what the others get
+
+        started = time.perf_counter()
+        tested_function(*copied_args)
+        first_calls.append(time.perf_counter() - started)
+
+    from .config import setup
+
+    steady_calls: list[float] = []
+    for _, tested_function in functions:
+        test = setup(module_name, 1).cases[0]
+        test.repetitions = test.autorange(tested_function, 0.05)
+        steady_calls.append(test.benchmark(tested_function))
+
+    return {
+        'import_time': import_time,
+        'calls': [[title, first, steady] for (title, _), first, steady in zip(functions, first_calls, steady_calls)],
+    }
+
+
+if __name__ == '__main__':
+    measurements: dict = measure_startup(sys.argv[1])
+
+    import json
+
+    json.dump(measurements, sys.stdout)
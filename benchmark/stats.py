@@ -0,0 +1,49 @@
+import math
+import statistics
+from dataclasses import dataclass
+from typing import Self
+
+
+def percentile(sorted_samples: list[float], percent: float) -> float:
+    position: float = (len(sorted_samples) - 1) * percent / 100  # Linearly interpolate between the two closest ranks
+    lower: int = math.floor(position)
+    upper: int = min(lower + 1, len(sorted_samples) - 1)
+
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+@dataclass(slots=True)
+class Summary:
+    count: int
+    mean: float
+    minimum: float
+    median: float
+    p90: float
+    p99: float
+    stddev: float
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> Self:
+        sorted_samples: list[float] = sorted(samples)
+
+        return cls(
+            len(sorted_samples),
+            statistics.fmean(sorted_samples),
+            sorted_samples[0],
+            percentile(sorted_samples, 50),
+            percentile(sorted_samples, 90),
+            percentile(sorted_samples, 99),
+            statistics.stdev(sorted_samples) if len(sorted_samples) > 1 else 0.0,
+        )
+
+    def __str__(self) -> str:
+        return ', '.join(
+            f'{name} {value * 1000:.6f} ms'
+            for name, value in (
+                ('min', self.minimum),
+                ('median', self.median),
+                ('p90', self.p90),
+                ('p99', self.p99),
+                ('stddev', self.stddev),
+            )
+        )
@@ -0,0 +1,126 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from typing import Self
+
+from .runner import Result
+
+
+@dataclass(slots=True)
+class Record:
+    timestamp: float
+    commit: str | None
+    machine: str
+
+    challenge: str
+    implementation: str
+    case: int
+
+    time: float
+    repetitions: int
+
+    settings: str = ''  # How the time was measured, as only times measured the same way can be compared
+    dirty: bool = False  # Whether the checkout had uncommitted changes, so the commit doesn't describe the code that ran
+
+    @property
+    def key(self) -> tuple[str, str, str, int, str]:
+        return (self.machine, self.challenge, self.implementation, self.case, self.settings)
+
+    @classmethod
+    def from_result(cls, result: Result, commit: str | None, dirty: bool, settings: str, machine: str, timestamp: float) -> Self:
+        assert result.time is not None
+
+        return cls(
+            timestamp, commit, machine, result.challenge, result.implementation, result.case, result.time, result.repetitions, settings, dirty
+        )
+
+
+def machine_fingerprint() -> str:
+    machine: str = '|'.join([platform.node(), platform.machine(), platform.processor(), platform.python_version(), str(os.cpu_count())])
+
+    return hashlib.sha256(machine.encode()).hexdigest()[:12]
+
+
+def git_commit(revision: str = 'HEAD') -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--verify', revision], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):  # Not in a git checkout, or the revision doesn't exist
+        return None
+
+
+def git_dirty() -> bool:
+    try:
+        changes: str = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True, text=True, check=True
+        ).stdout
+
+        return bool(changes.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
+def measurement_settings(arguments: argparse.Namespace) -> str:
+    settings: list[str] = ['median' if arguments.stats else 'mean']
+
+    if arguments.autorange is not None:  # The repetition count changes from run to run then, so the target is what stays the same
+        settings.append(f'autorange={arguments.autorange}')
+    else:
+        settings.append(f'repetitions={arguments.test_repetitions}')
+
+    if arguments.shuffle:
+        settings.append(f'blocks={arguments.blocks}')
+
+    settings += [flag for flag in ('fresh_args', 'calibrate', 'gc', 'isolate') if getattr(arguments, flag)]
+
+    return ','.join(settings)
+
+
+def to_records(results: list[Result], settings: str) -> list[Record]:
+    commit: str | None = git_commit()
+    dirty: bool = git_dirty()
+    machine: str = machine_fingerprint()
+    timestamp: float = time.time()
+
+    return [Record.from_result(result, commit, dirty, settings, machine, timestamp) for result in results if result.time is not None]
+
+
+def save_records(path: str, records: list[Record]):
+    with open(path, 'a') as store:
+        for record in records:
+            store.write(json.dumps(asdict(record)) + '\n')
+
+
+def load_records(path: str) -> list[Record]:
+    try:
+        with open(path) as store:
+            return [Record(**json.loads(line)) for line in store if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def baseline_records(records: list[Record], baseline: str) -> dict[tuple[str, str, str, int, str], Record]:
+    commit: str = git_commit(baseline) or baseline  # Fall back to treating it as a commit prefix from the store
+    machine: str = machine_fingerprint()
+
+    latest: dict[tuple[str, str, str, int, str], Record] = {}
+    for record in records:
+        # Runs with uncommitted changes measured some other code than the commit, so they can't be a baseline for it
+        if record.machine == machine and not record.dirty and record.commit is not None and record.commit.startswith(commit):
+            latest[record.key] = record  # Records are appended in order, so later runs win
+
+    return latest
+
+
+def find_regressions(
+    current: list[Record], baseline: dict[tuple[str, str, str, int, str], Record], threshold: float
+) -> list[tuple[Record, Record]]:
+    return [
+        (baseline[record.key], record)
+        for record in current
+        if record.key in baseline and record.time > baseline[record.key].time * (1 + threshold / 100)
+    ]
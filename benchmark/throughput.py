@@ -0,0 +1,102 @@
+import copy
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from .config import Args, Test, TestedFunction, TestProfile
+from .runner import Task, load_profile
+
+
+START_DELAY: float = 0.5  # Seconds given to every worker to get ready, so they all start calling at the same moment
+
+
+@dataclass(slots=True)
+class Throughput:
+    challenge: str
+    implementation: str
+    case: int
+
+    executor: str
+    workers: int
+    calls_per_second: float
+
+
+def call_until(tested_function: TestedFunction[Any], args: Args, start: float, deadline: float, pool_size: int | None = None) -> int:
+    time.sleep(max(start - time.time(), 0))
+
+    calls: int = 0
+    if pool_size is None:
+        while time.time() < deadline:
+            tested_function(*args)
+            calls += 1
+
+        return calls
+
+    while True:
+        copying_started: float = time.time()
+        pool: list[Args] = [copy.deepcopy(args) for _ in range(pool_size)]
+        deadline += time.time() - copying_started  # Copying doesn't count against the duration
+
+        for copied_args in pool:
+            if time.time() >= deadline:
+                return calls
+
+            tested_function(*copied_args)
+            calls += 1
+
+
+def count_calls_in_process(task: Task, repetitions: int, start: float, deadline: float, pool_size: int | None) -> int:
+    test_profile: TestProfile[Any] = load_profile(task.module_name, repetitions)
+    tested_function: TestedFunction[Any] = dict(test_profile.functions)[task.implementation]
+
+    return call_until(tested_function, copy.deepcopy(test_profile.cases[task.case - 1].args), start, deadline, pool_size)
+
+
+def threads_throughput(tested_function: TestedFunction[Any], args: Args, workers: int, duration: float, pool_size: int | None) -> float:
+    start: float = time.time() + START_DELAY
+    counts: list[int] = [0] * workers
+
+    def count_calls(worker_id: int, worker_args: Args):
+        counts[worker_id] = call_until(tested_function, worker_args, start, start + duration, pool_size)
+
+    threads: list[threading.Thread] = [
+        threading.Thread(target=count_calls, args=(worker_id, copy.deepcopy(args))) for worker_id in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return sum(counts) / duration
+
+
+def processes_throughput(task: Task, repetitions: int, workers: int, duration: float, pool_size: int | None) -> float:
+    with ProcessPoolExecutor(workers) as executor:
+        start: float = time.time() + START_DELAY
+        futures = [executor.submit(count_calls_in_process, task, repetitions, start, start + duration, pool_size) for _ in range(workers)]
+
+        return sum(future.result() for future in futures) / duration
+
+
+def measure_throughput(
+    challenge: str, task: Task, repetitions: int, worker_counts: list[int], duration: float, pool_size: int | None = None
+) -> list[Throughput]:
+    test_profile: TestProfile[Any] = load_profile(task.module_name, repetitions)
+    tested_function: TestedFunction[Any] = dict(test_profile.functions)[task.implementation]
+    test: Test[Any] = test_profile.cases[task.case - 1]
+
+    test.verified_args(tested_function)  # Only checks the output, every worker copies the original args for itself
+
+    throughputs: list[Throughput] = []
+    for workers in worker_counts:
+        threads_rate: float = threads_throughput(tested_function, test.args, workers, duration, pool_size)
+        processes_rate: float = processes_throughput(task, repetitions, workers, duration, pool_size)
+
+        throughputs += [
+            Throughput(challenge, task.implementation, task.case, 'threads', workers, threads_rate),
+            Throughput(challenge, task.implementation, task.case, 'processes', workers, processes_rate),
+        ]
+
+    return throughputs